@@ -2,27 +2,45 @@
 AI Routes for FastAPI with Full Integration
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, Any, Optional, List
-import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from uuid import uuid4
+import asyncio
+import hashlib
+import json
+import logging
 import os
+import threading
+import time
 
-# Absolute import fix
-current_dir = os.path.dirname(os.path.abspath(__file__))
-backend_path = os.path.join(current_dir, '..', '..')
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
+logger = logging.getLogger(__name__)
 
 try:
     from core.ai_engine import AICoreEngine
     ENGINE_AVAILABLE = True
-    print("✅ AI Engine imported successfully")
+    logger.info("AI Engine imported successfully")
 except ImportError as e:
-    print(f"⚠️  Core engine import warning: {e}")
+    logger.warning("Core engine import warning: %s", e)
     ENGINE_AVAILABLE = False
 
+# Faster JSON serialization when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Check for optional components
+try:
+    from core.character_loader import CharacterLoader
+    CHARACTER_LOADER_AVAILABLE = True
+except ImportError:
+    CHARACTER_LOADER_AVAILABLE = False
+
 try:
     from core.voice_processor import VoiceProcessor
     VOICE_PROCESSOR_AVAILABLE = True
@@ -42,50 +60,273 @@ except ImportError:
     DATABASE_MANAGER_AVAILABLE = False
 
 # Request models
+MAX_TEXT_LENGTH = 8192
+
+_REQUEST_MODEL_CONFIG = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
+
 class TextInput(BaseModel):
-    text: str
+    model_config = _REQUEST_MODEL_CONFIG
+    text: str = Field(..., max_length=MAX_TEXT_LENGTH)
 
 class ProfileSwitchRequest(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
     profile_id: str
-    character_id: str = None
+    character_id: Optional[str] = None
 
 class CharacterSwitchRequest(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
     character_id: str
 
 class BackupRequest(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
     backup_path: Optional[str] = None
 
 class SpeakTextRequest(BaseModel):
-    text: str
+    model_config = _REQUEST_MODEL_CONFIG
+    text: str = Field(..., max_length=MAX_TEXT_LENGTH)
     blocking: bool = False
 
 class SyncStartRequest(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
     auto_sync: bool = True
     watch_files: bool = True
 
 # Router
-router = APIRouter(prefix="/ai", tags=["AI Engine"])
-
-# AI engine instance
+router = APIRouter(
+    prefix="/ai",
+    tags=["AI Engine"],
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+)
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize a payload to JSON bytes with the fastest available encoder"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+
+def _json_bytes_response(content: bytes) -> Response:
+    """Wrap pre-serialized JSON bytes in a response without re-encoding"""
+    return Response(content=content, media_type="application/json")
+
+def _with_etag(content: bytes) -> tuple:
+    """Pair serialized JSON bytes with a strong ETag derived from their content"""
+    return content, '"%s"' % hashlib.blake2b(content, digest_size=16).hexdigest()
+
+def _etag_response(request: Request, entry: tuple) -> Response:
+    """Reply 304 when the client already holds this entry, else send the cached bytes"""
+    content, etag = entry
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in (
+            tag.strip().replace("W/", "", 1) for tag in if_none_match.split(","))):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
+
+# Blocking engine calls run on this pool so the event loop stays free
+_EXECUTOR = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2)
+
+async def _run_blocking(func, *args):
+    """Run a blocking engine call on the worker pool and await its result"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, func, *args)
+
+class _TTLCache:
+    """Small time-based cache for GET responses that rarely change"""
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._entries: Dict[Any, tuple] = {}
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float):
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            now = time.monotonic()
+            self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+            if len(self._entries) >= self.maxsize:
+                self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def clear(self):
+        self._entries.clear()
+
+# Cache lifetimes (seconds) for polled GET endpoints
+STATUS_CACHE_TTL = 1
+CATALOG_CACHE_TTL = 30
+
+_response_cache = _TTLCache()
+
+# Serializes profile/character switches; readers use the engine's state snapshot without locking
+_engine_write_lock: Optional[asyncio.Lock] = None
+
+def _get_write_lock() -> asyncio.Lock:
+    """Return the engine write lock, creating it on the running event loop"""
+    global _engine_write_lock
+    if _engine_write_lock is None:
+        _engine_write_lock = asyncio.Lock()
+    return _engine_write_lock
+
+# Caps concurrent process_input calls so bursts queue instead of oversubscribing the pool
+MAX_CONCURRENT_PROCESSING = os.cpu_count() or 1
+
+_processing_semaphore: Optional[asyncio.Semaphore] = None
+
+def _get_processing_semaphore() -> asyncio.Semaphore:
+    """Return the processing semaphore, creating it on the running event loop"""
+    global _processing_semaphore
+    if _processing_semaphore is None:
+        _processing_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROCESSING)
+    return _processing_semaphore
+
+# Long-running database jobs (backup/cleanup); run one at a time, polled by job id
+MAX_TRACKED_JOBS = 100
+
+_jobs: Dict[str, Dict[str, Any]] = {}
+_db_job_lock: Optional[asyncio.Lock] = None
+
+def _get_db_job_lock() -> asyncio.Lock:
+    """Return the database job lock, creating it on the running event loop"""
+    global _db_job_lock
+    if _db_job_lock is None:
+        _db_job_lock = asyncio.Lock()
+    return _db_job_lock
+
+def _create_job(kind: str) -> str:
+    """Register a queued job and return its id, dropping the oldest finished jobs"""
+    if len(_jobs) >= MAX_TRACKED_JOBS:
+        for old_id in [jid for jid, job in _jobs.items() if job["status"] in ("completed", "failed")]:
+            _jobs.pop(old_id)
+            if len(_jobs) < MAX_TRACKED_JOBS:
+                break
+    job_id = uuid4().hex
+    _jobs[job_id] = {"job_id": job_id, "type": kind, "status": "queued", "created_at": time.time()}
+    return job_id
+
+async def _run_job(job_id: str, func, *args):
+    """Run a queued job on the worker pool after any earlier database job has finished"""
+    job = _jobs[job_id]
+    async with _get_db_job_lock():
+        job["status"] = "running"
+        job["started_at"] = time.time()
+        try:
+            job["result"] = await _run_blocking(func, *args)
+            job["status"] = "completed"
+        except Exception as e:
+            logger.error("Database job %s failed: %s", job_id, e)
+            job["status"] = "failed"
+            job["error"] = str(e)
+        job["finished_at"] = time.time()
+
+# NDJSON stream frame size; small progress events are coalesced up to this many bytes
+STREAM_CHUNK_BYTES = 1490
+
+async def _ndjson_stream(events):
+    """Encode progress events as NDJSON, sending the first at once and batching the rest"""
+    buffer = bytearray()
+    first = True
+    async for event in events:
+        buffer += _dumps(event) + b"\n"
+        if first or len(buffer) >= STREAM_CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+            first = False
+    if buffer:
+        yield bytes(buffer)
+
+@lru_cache(maxsize=None)
+def get_engine() -> "AICoreEngine":
+    """Create the shared AI engine exactly once per process"""
+    engine = AICoreEngine()
+    # Default profile ve karakter ile başlat
+    engine.initialize("personal", "artemis")
+    return engine
+
+# AI engine instance, created by the startup hook
 ai_engine = None
-if ENGINE_AVAILABLE:
+
+# Shared character loader for compatibility lookups (reuse the engine's when present)
+_character_loader = None
+
+# Optional engine components, resolved once the engine is created
+_FEATURES = {"voice": False, "sync": False, "db": False}
+
+def _create_engine():
+    """Create the shared engine and resolve the components the routes depend on"""
+    global ai_engine, ENGINE_AVAILABLE, _character_loader
+    if ENGINE_AVAILABLE:
+        try:
+            ai_engine = get_engine()
+            logger.info("AI Engine instance created")
+        except Exception as e:
+            logger.warning("AI Engine creation error: %s", e)
+            ENGINE_AVAILABLE = False
+    
+    _character_loader = getattr(ai_engine, 'character_loader', None)
+    if _character_loader is None and CHARACTER_LOADER_AVAILABLE:
+        try:
+            _character_loader = CharacterLoader()
+        except Exception as e:
+            logger.warning("Character Loader creation error: %s", e)
+    _compatibility_entry.cache_clear()
+    
+    _FEATURES.update(
+        voice=getattr(ai_engine, 'voice_processor', None) is not None,
+        sync=getattr(ai_engine, 'sync_service', None) is not None,
+        db=getattr(ai_engine, 'database_manager', None) is not None,
+    )
+
+@lru_cache(maxsize=128)
+def _compatibility_entry(profile_id: str) -> tuple:
+    """Serialized compatibility reply and ETag for a profile; the catalog is static between reloads"""
+    compatible = _character_loader.get_compatible_characters(profile_id)
+    return _with_etag(_dumps({"profile": profile_id, "compatible_characters": compatible}))
+
+def require_engine() -> Any:
+    """Route dependency that returns the shared engine or rejects the request"""
+    if not ENGINE_AVAILABLE or ai_engine is None:
+        raise HTTPException(status_code=500, detail="AI Engine not available")
+    return ai_engine
+
+def _require_feature(feature: str, detail: str):
+    """Build a route dependency that rejects requests when an optional component is missing"""
+    def check_feature():
+        if not _FEATURES[feature]:
+            raise HTTPException(status_code=500, detail=detail)
+    return Depends(check_feature)
+
+_REQUIRE_VOICE = _require_feature("voice", "Voice Processor not available")
+_REQUIRE_SYNC = _require_feature("sync", "Sync Service not available")
+_REQUIRE_DB = _require_feature("db", "Database Manager not available")
+
+def _warm_up_engine():
+    """Warm engine caches off the event loop"""
     try:
-        ai_engine = AICoreEngine()
-        # Default profile ve karakter ile başlat
-        ai_engine.initialize("personal", "artemis")
-        print("✅ AI Engine instance created")
+        ai_engine.warm_up()
+        logger.info("AI Engine warm-up completed")
     except Exception as e:
-        print(f"⚠️  AI Engine creation error: {e}")
-        ENGINE_AVAILABLE = False
+        logger.warning("AI Engine warm-up error: %s", e)
+
+@router.on_event("startup")
+async def start_engine():
+    """Create the engine off the event loop, then warm it up in the background while the server accepts traffic"""
+    await _run_blocking(_create_engine)
+    if ENGINE_AVAILABLE and ai_engine is not None:
+        asyncio.get_running_loop().run_in_executor(_EXECUTOR, _warm_up_engine)
 
 @router.post("/process")
-async def process_input(input_data: TextInput):
+async def process_input(input_data: TextInput, include_metrics: bool = False,
+                        engine: Any = Depends(require_engine)):
     """Process user input with current profile and character"""
-    if not ENGINE_AVAILABLE or ai_engine is None:
-        raise HTTPException(status_code=500, detail="AI Engine not available")
-    
     try:
-        result = ai_engine.process_input(input_data.text)
+        async with _get_processing_semaphore():
+            result = await _run_blocking(engine.process_input, input_data.text, include_metrics)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -96,47 +337,60 @@ async def get_status():
     if not ENGINE_AVAILABLE or ai_engine is None:
         return {"status": "AI Engine not available"}
     
+    cached = _response_cache.get("status")
+    if cached is not None:
+        return _json_bytes_response(cached)
+    
     try:
-        status = ai_engine.get_status()
-        return status
+        status = await _run_blocking(ai_engine.get_status)
+        content = _dumps(status)
+        _response_cache.set("status", content, STATUS_CACHE_TTL)
+        return _json_bytes_response(content)
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
 @router.get("/profiles")
-async def list_profiles():
+async def list_profiles(request: Request, engine: Any = Depends(require_engine)):
     """List available profiles"""
-    if not ENGINE_AVAILABLE or ai_engine is None:
-        raise HTTPException(status_code=500, detail="AI Engine not available")
+    cached = _response_cache.get("profiles")
+    if cached is not None:
+        return _etag_response(request, cached)
     
     try:
-        profiles = ai_engine.get_available_profiles()
-        return {"profiles": profiles}
+        profiles = await _run_blocking(engine.get_available_profiles)
+        entry = _with_etag(_dumps({"profiles": profiles}))
+        _response_cache.set("profiles", entry, CATALOG_CACHE_TTL)
+        return _etag_response(request, entry)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/characters")
-async def list_characters():
+async def list_characters(request: Request, engine: Any = Depends(require_engine)):
     """List available characters"""
-    if not ENGINE_AVAILABLE or ai_engine is None:
-        raise HTTPException(status_code=500, detail="AI Engine not available")
+    cached = _response_cache.get("characters")
+    if cached is not None:
+        return _etag_response(request, cached)
     
     try:
-        characters = ai_engine.get_available_characters()
-        return {"characters": characters}
+        characters = await _run_blocking(engine.get_available_characters)
+        entry = _with_etag(_dumps({"characters": characters}))
+        _response_cache.set("characters", entry, CATALOG_CACHE_TTL)
+        return _etag_response(request, entry)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/profile/switch")
-async def switch_profile(profile_request: ProfileSwitchRequest):
+async def switch_profile(profile_request: ProfileSwitchRequest, engine: Any = Depends(require_engine)):
     """Switch to different profile (and optionally character)"""
-    if not ENGINE_AVAILABLE or ai_engine is None:
-        raise HTTPException(status_code=500, detail="AI Engine not available")
-    
     try:
-        success = ai_engine.switch_profile(
-            profile_request.profile_id, 
-            profile_request.character_id
-        )
+        async with _get_write_lock():
+            success = await _run_blocking(
+                engine.switch_profile,
+                profile_request.profile_id,
+                profile_request.character_id
+            )
+            _response_cache.clear()
+            _compatibility_entry.cache_clear()
         if success:
             return {
                 "message": f"Switched to profile: {profile_request.profile_id}" + 
@@ -148,17 +402,19 @@ async def switch_profile(profile_request: ProfileSwitchRequest):
                 status_code=400, 
                 detail=f"Failed to switch to profile: {profile_request.profile_id}"
             )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/character/switch")
-async def switch_character(character_request: CharacterSwitchRequest):
+async def switch_character(character_request: CharacterSwitchRequest, engine: Any = Depends(require_engine)):
     """Switch to different character"""
-    if not ENGINE_AVAILABLE or ai_engine is None:
-        raise HTTPException(status_code=500, detail="AI Engine not available")
-    
     try:
-        success = ai_engine.switch_character(character_request.character_id)
+        async with _get_write_lock():
+            success = await _run_blocking(engine.switch_character, character_request.character_id)
+            _response_cache.clear()
+            _compatibility_entry.cache_clear()
         if success:
             return {
                 "message": f"Switched to character: {character_request.character_id}",
@@ -169,37 +425,29 @@ async def switch_character(character_request: CharacterSwitchRequest):
                 status_code=400, 
                 detail=f"Failed to switch to character: {character_request.character_id}"
             )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/compatibility/{profile_id}")
-async def get_compatible_characters(profile_id: str):
+async def get_compatible_characters(profile_id: str, request: Request, engine: Any = Depends(require_engine)):
     """Get characters compatible with specific profile"""
-    if not ENGINE_AVAILABLE:
-        raise HTTPException(status_code=500, detail="AI Engine not available")
+    if _character_loader is None:
+        raise HTTPException(status_code=500, detail="Character Loader not available")
     
     try:
-        # Try to access character loader directly
-        from core.character_loader import CharacterLoader
-        loader = CharacterLoader()
-        compatible = loader.get_compatible_characters(profile_id)
-        return {"profile": profile_id, "compatible_characters": compatible}
+        return _etag_response(request, _compatibility_entry(profile_id))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # Voice-related endpoints (only if VoiceProcessor is available)
-if VOICE_PROCESSOR_AVAILABLE and ENGINE_AVAILABLE and ai_engine and hasattr(ai_engine, 'voice_processor'):
-    @router.post("/voice/start")
-    async def start_voice_listening(continuous: bool = True):
+if VOICE_PROCESSOR_AVAILABLE and ENGINE_AVAILABLE:
+    @router.post("/voice/start", dependencies=[_REQUIRE_VOICE])
+    async def start_voice_listening(continuous: bool = True, engine: Any = Depends(require_engine)):
         """Start voice recognition listening"""
-        if not ENGINE_AVAILABLE or ai_engine is None:
-            raise HTTPException(status_code=500, detail="AI Engine not available")
-        
         try:
-            if not hasattr(ai_engine, 'voice_processor') or ai_engine.voice_processor is None:
-                raise HTTPException(status_code=500, detail="Voice Processor not available")
-            
-            success = ai_engine.start_voice_listening(continuous)
+            success = await _run_blocking(engine.start_voice_listening, continuous)
             return {
                 "success": success,
                 "message": "Voice listening started" if success else "Failed to start voice listening"
@@ -207,69 +455,56 @@ if VOICE_PROCESSOR_AVAILABLE and ENGINE_AVAILABLE and ai_engine and hasattr(ai_e
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
-    @router.post("/voice/stop")
-    async def stop_voice_listening():
+    @router.post("/voice/stop", dependencies=[_REQUIRE_VOICE])
+    async def stop_voice_listening(engine: Any = Depends(require_engine)):
         """Stop voice recognition listening"""
-        if not ENGINE_AVAILABLE or ai_engine is None:
-            raise HTTPException(status_code=500, detail="AI Engine not available")
-        
         try:
-            if not hasattr(ai_engine, 'voice_processor') or ai_engine.voice_processor is None:
-                raise HTTPException(status_code=500, detail="Voice Processor not available")
-            
-            ai_engine.stop_voice_listening()
+            await _run_blocking(engine.stop_voice_listening)
             return {"success": True, "message": "Voice listening stopped"}
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
-    @router.post("/voice/speak")
-    async def speak_text(text_request: SpeakTextRequest):
+    @router.post("/voice/speak", dependencies=[_REQUIRE_VOICE])
+    async def speak_text(text_request: SpeakTextRequest, engine: Any = Depends(require_engine)):
         """Convert text to speech"""
-        if not ENGINE_AVAILABLE or ai_engine is None:
-            raise HTTPException(status_code=500, detail="AI Engine not available")
+        # Errors after the response has started can only be reported in the stream
+        async def speak_events():
+            yield {"status": "speaking", "characters": len(text_request.text)}
+            try:
+                success = await _run_blocking(
+                    engine.speak_response, text_request.text, text_request.blocking
+                )
+                yield {
+                    "status": "completed",
+                    "success": success,
+                    "message": "Speaking text" if success else "Failed to speak text"
+                }
+            except Exception as e:
+                yield {"status": "error", "success": False, "error": str(e)}
         
-        try:
-            if not hasattr(ai_engine, 'voice_processor') or ai_engine.voice_processor is None:
-                raise HTTPException(status_code=500, detail="Voice Processor not available")
-            
-            success = ai_engine.speak_response(text_request.text, text_request.blocking)
-            return {
-                "success": success,
-                "message": "Speaking text" if success else "Failed to speak text"
-            }
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        return StreamingResponse(_ndjson_stream(speak_events()), media_type="application/x-ndjson")
 
     @router.get("/voice/status")
-    async def get_voice_status():
+    async def get_voice_status(engine: Any = Depends(require_engine)):
         """Get voice processor status"""
-        if not ENGINE_AVAILABLE or ai_engine is None:
-            raise HTTPException(status_code=500, detail="AI Engine not available")
-        
         try:
-            if not hasattr(ai_engine, 'voice_processor') or ai_engine.voice_processor is None:
+            if not _FEATURES["voice"]:
                 return {"status": "Voice Processor not available"}
             
-            status = ai_engine.voice_processor.get_status()
+            status = await _run_blocking(engine.voice_processor.get_status)
             return status
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
-    @router.post("/voice/test")
-    async def test_voice_system():
+    @router.post("/voice/test", dependencies=[_REQUIRE_VOICE])
+    async def test_voice_system(engine: Any = Depends(require_engine)):
         """Test voice system functionality"""
-        if not ENGINE_AVAILABLE or ai_engine is None:
-            raise HTTPException(status_code=500, detail="AI Engine not available")
-        
         try:
-            if not hasattr(ai_engine, 'voice_processor') or ai_engine.voice_processor is None:
-                raise HTTPException(status_code=500, detail="Voice Processor not available")
-            
             # Test microphone
-            mic_test = ai_engine.voice_processor.test_microphone()
+            mic_test = await _run_blocking(engine.voice_processor.test_microphone)
             
             # Test TTS with a simple phrase
-            tts_success = ai_engine.speak_response("Voice system test successful", blocking=True)
+            tts_success = await _run_blocking(engine.speak_response, "Voice system test successful", True)
             
             return {
                 "microphone_test": mic_test,
@@ -280,21 +515,15 @@ if VOICE_PROCESSOR_AVAILABLE and ENGINE_AVAILABLE and ai_engine and hasattr(ai_e
             raise HTTPException(status_code=500, detail=str(e))
 
 # Sync-related endpoints (only if SyncService is available)
-if SYNC_SERVICE_AVAILABLE and ENGINE_AVAILABLE and ai_engine and hasattr(ai_engine, 'sync_service'):
-    @router.post("/sync/start")
-    async def start_sync_service(sync_request: SyncStartRequest = None):
+if SYNC_SERVICE_AVAILABLE and ENGINE_AVAILABLE:
+    @router.post("/sync/start", dependencies=[_REQUIRE_SYNC])
+    async def start_sync_service(sync_request: SyncStartRequest = None, engine: Any = Depends(require_engine)):
         """Start sync service"""
-        if not ENGINE_AVAILABLE or ai_engine is None:
-            raise HTTPException(status_code=500, detail="AI Engine not available")
-        
         try:
-            if not hasattr(ai_engine, 'sync_service') or ai_engine.sync_service is None:
-                raise HTTPException(status_code=500, detail="Sync Service not available")
-            
             auto_sync = sync_request.auto_sync if sync_request else True
             watch_files = sync_request.watch_files if sync_request else True
             
-            success = ai_engine.sync_service.start_sync_service(auto_sync, watch_files)
+            success = await _run_blocking(engine.sync_service.start_sync_service, auto_sync, watch_files)
             return {
                 "success": success,
                 "message": "Sync service started" if success else "Failed to start sync service"
@@ -302,151 +531,154 @@ if SYNC_SERVICE_AVAILABLE and ENGINE_AVAILABLE and ai_engine and hasattr(ai_engi
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
-    @router.post("/sync/stop")
-    async def stop_sync_service():
+    @router.post("/sync/stop", dependencies=[_REQUIRE_SYNC])
+    async def stop_sync_service(engine: Any = Depends(require_engine)):
         """Stop sync service"""
-        if not ENGINE_AVAILABLE or ai_engine is None:
-            raise HTTPException(status_code=500, detail="AI Engine not available")
-        
         try:
-            if not hasattr(ai_engine, 'sync_service') or ai_engine.sync_service is None:
-                raise HTTPException(status_code=500, detail="Sync Service not available")
-            
-            ai_engine.sync_service.stop_sync_service()
+            await _run_blocking(engine.sync_service.stop_sync_service)
             return {"success": True, "message": "Sync service stopped"}
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
-    @router.post("/sync/force")
-    async def force_sync():
+    @router.post("/sync/force", dependencies=[_REQUIRE_SYNC])
+    async def force_sync(engine: Any = Depends(require_engine)):
         """Force immediate sync"""
-        if not ENGINE_AVAILABLE or ai_engine is None:
-            raise HTTPException(status_code=500, detail="AI Engine not available")
-        
-        try:
-            if not hasattr(ai_engine, 'sync_service') or ai_engine.sync_service is None:
-                raise HTTPException(status_code=500, detail="Sync Service not available")
+        # Errors after the response has started can only be reported in the stream
+        async def sync_events():
+            sync_iter = None
+            iter_lock = threading.Lock()
             
-            result = ai_engine.sync_service.force_sync()
-            return result
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+            def next_event():
+                with iter_lock:
+                    return next(sync_iter, None)
+            
+            def close_iter():
+                # Waits for a step still running on the pool, then runs the
+                # sync's own cleanup, which clears is_syncing
+                with iter_lock:
+                    sync_iter.close()
+            
+            try:
+                sync_iter = await _run_blocking(engine.sync_service.iter_force_sync)
+                while True:
+                    event = await _run_blocking(next_event)
+                    if event is None:
+                        break
+                    yield event
+            except Exception as e:
+                yield {"status": "error", "error": str(e)}
+            finally:
+                # Also reached when the client disconnects mid-sync
+                if sync_iter is not None:
+                    _EXECUTOR.submit(close_iter)
+        
+        return StreamingResponse(_ndjson_stream(sync_events()), media_type="application/x-ndjson")
 
     @router.get("/sync/status")
-    async def get_sync_status():
+    async def get_sync_status(engine: Any = Depends(require_engine)):
         """Get sync service status"""
-        if not ENGINE_AVAILABLE or ai_engine is None:
-            raise HTTPException(status_code=500, detail="AI Engine not available")
-        
         try:
-            if not hasattr(ai_engine, 'sync_service') or ai_engine.sync_service is None:
+            if not _FEATURES["sync"]:
                 return {"status": "Sync Service not available"}
             
-            status = ai_engine.sync_service.get_sync_status()
+            status = await _run_blocking(engine.sync_service.get_sync_status)
             return status
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
-    @router.get("/sync/files")
-    async def get_tracked_files():
+    @router.get("/sync/files", dependencies=[_REQUIRE_SYNC])
+    async def get_tracked_files(engine: Any = Depends(require_engine)):
         """Get list of tracked files"""
-        if not ENGINE_AVAILABLE or ai_engine is None:
-            raise HTTPException(status_code=500, detail="AI Engine not available")
-        
         try:
-            if not hasattr(ai_engine, 'sync_service') or ai_engine.sync_service is None:
-                raise HTTPException(status_code=500, detail="Sync Service not available")
-            
-            files = ai_engine.sync_service.get_tracked_files()
+            files = await _run_blocking(engine.sync_service.get_tracked_files)
             return {"files": files, "count": len(files)}
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
 # Database-related endpoints (only if DatabaseManager is available)
-if DATABASE_MANAGER_AVAILABLE and ENGINE_AVAILABLE and ai_engine and hasattr(ai_engine, 'database_manager'):
-    @router.post("/database/backup")
-    async def backup_database(backup_request: BackupRequest = None):
-        """Backup database"""
-        if not ENGINE_AVAILABLE or ai_engine is None or ai_engine.database_manager is None:
-            raise HTTPException(status_code=500, detail="Database Manager not available")
-        
-        try:
-            backup_path = backup_request.backup_path if backup_request else None
-            success = ai_engine.database_manager.backup_database(backup_path)
-            return {
-                "success": success, 
-                "message": "Database backup completed" if success else "Backup failed",
-                "backup_path": backup_path or "default_location"
-            }
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+if DATABASE_MANAGER_AVAILABLE and ENGINE_AVAILABLE:
+    @router.post("/database/backup", status_code=202, dependencies=[_REQUIRE_DB])
+    async def backup_database(background_tasks: BackgroundTasks, backup_request: BackupRequest = None,
+                              engine: Any = Depends(require_engine)):
+        """Queue a database backup and return its job id"""
+        backup_path = backup_request.backup_path if backup_request else None
+        job_id = _create_job("backup")
+        background_tasks.add_task(_run_job, job_id, engine.database_manager.backup_database, backup_path)
+        return {
+            "job_id": job_id,
+            "status": "queued",
+            "backup_path": backup_path or "default_location"
+        }
 
-    @router.get("/database/stats")
-    async def get_database_stats():
+    @router.get("/database/stats", dependencies=[_REQUIRE_DB])
+    async def get_database_stats(engine: Any = Depends(require_engine)):
         """Get database statistics"""
-        if not ENGINE_AVAILABLE or ai_engine is None or ai_engine.database_manager is None:
-            raise HTTPException(status_code=500, detail="Database Manager not available")
-        
         try:
-            stats = ai_engine.database_manager.get_database_stats()
+            stats = await _run_blocking(engine.database_manager.get_database_stats)
             return stats
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
-    @router.get("/database/metrics")
-    async def get_database_metrics(category: str = None, hours: int = 24):
+    @router.get("/database/metrics", dependencies=[_REQUIRE_DB])
+    async def get_database_metrics(category: str = None, hours: int = 24, engine: Any = Depends(require_engine)):
         """Get database metrics"""
-        if not ENGINE_AVAILABLE or ai_engine is None or ai_engine.database_manager is None:
-            raise HTTPException(status_code=500, detail="Database Manager not available")
-        
         try:
-            metrics = ai_engine.database_manager.get_metrics_summary(category, hours)
+            metrics = await _run_blocking(engine.database_manager.get_metrics_summary, category, hours)
             return metrics
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
-    @router.post("/database/cleanup")
-    async def cleanup_database(days_to_keep: int = 30):
-        """Clean up old database records"""
-        if not ENGINE_AVAILABLE or ai_engine is None or ai_engine.database_manager is None:
-            raise HTTPException(status_code=500, detail="Database Manager not available")
-        
-        try:
-            results = ai_engine.database_manager.cleanup_old_data(days_to_keep)
-            return {
-                "success": True,
-                "cleanup_results": results,
-                "message": f"Cleaned up data older than {days_to_keep} days"
-            }
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+    @router.post("/database/cleanup", status_code=202, dependencies=[_REQUIRE_DB])
+    async def cleanup_database(background_tasks: BackgroundTasks, days_to_keep: int = 30,
+                               engine: Any = Depends(require_engine)):
+        """Queue a cleanup of old database records and return its job id"""
+        job_id = _create_job("cleanup")
+        background_tasks.add_task(_run_job, job_id, engine.database_manager.cleanup_old_data, days_to_keep)
+        return {
+            "job_id": job_id,
+            "status": "queued",
+            "message": f"Cleanup of data older than {days_to_keep} days queued"
+        }
+
+    @router.get("/database/job/{job_id}", dependencies=[_REQUIRE_DB])
+    async def get_database_job(job_id: str):
+        """Get the status of a queued database job"""
+        job = _jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+        return job
+
+# Fixed replies, serialized once at import
+_TEST_RESPONSE = _json_bytes_response(_dumps({"message": "AI Routes working!"}))
+_DEGRADED_HEALTH_RESPONSE = _json_bytes_response(_dumps({
+    "status": "degraded",
+    "engine": "not_initialized",
+    "message": "AI Engine components may be missing"
+}))
 
 @router.get("/test")
 async def test_route():
     """Test endpoint"""
-    return {"message": "AI Routes working!"}
+    return _TEST_RESPONSE
 
 # Health check endpoint
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
-    if ENGINE_AVAILABLE and ai_engine and ai_engine.is_initialized:
+    if ENGINE_AVAILABLE and ai_engine and ai_engine.current_state.is_initialized:
         return {
             "status": "healthy",
             "engine": "running",
+            "warm": ai_engine.is_warm,
             "components": {
                 "profile_manager": ai_engine.profile_manager is not None,
                 "character_loader": ai_engine.character_loader is not None,
                 "context_manager": ai_engine.context_manager is not None,
                 "response_generator": ai_engine.response_generator is not None,
-                "voice_processor": hasattr(ai_engine, 'voice_processor') and ai_engine.voice_processor is not None,
-                "sync_service": hasattr(ai_engine, 'sync_service') and ai_engine.sync_service is not None,
-                "database_manager": hasattr(ai_engine, 'database_manager') and ai_engine.database_manager is not None
+                "voice_processor": _FEATURES["voice"],
+                "sync_service": _FEATURES["sync"],
+                "database_manager": _FEATURES["db"]
             }
         }
     else:
-        return {
-            "status": "degraded",
-            "engine": "not_initialized",
-            "message": "AI Engine components may be missing"
-        }
+        return _DEGRADED_HEALTH_RESPONSE
@@ -2,85 +2,248 @@
 Enhanced AI Core Engine with Database Integration
 """
 
+import importlib
 import logging
+import re
+import threading
+from collections import deque, namedtuple
+from types import MappingProxyType
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, Optional
 import sys
 import os
 import time
 
-# Component imports
-try:
-    from .profile_manager import ProfileManager
-    PROFILE_MANAGER_AVAILABLE = True
-except ImportError as e:
-    print(f"Profile Manager not available: {e}")
-    PROFILE_MANAGER_AVAILABLE = False
+# Component imports are deferred to first use so importing this module stays cheap;
+# each *_AVAILABLE flag is None until its component has been looked up
+PROFILE_MANAGER_AVAILABLE = None
+CHARACTER_LOADER_AVAILABLE = None
+CONTEXT_MANAGER_AVAILABLE = None
+RESPONSE_GENERATOR_AVAILABLE = None
+DATABASE_MANAGER_AVAILABLE = None
+VOICE_PROCESSOR_AVAILABLE = None
 
-try:
-    from .character_loader import CharacterLoader
-    CHARACTER_LOADER_AVAILABLE = True
-except ImportError as e:
-    print(f"Character Loader not available: {e}")
-    CHARACTER_LOADER_AVAILABLE = False
+_COMPONENT_MODULES = {
+    "ProfileManager": (".profile_manager", "PROFILE_MANAGER_AVAILABLE"),
+    "CharacterLoader": (".character_loader", "CHARACTER_LOADER_AVAILABLE"),
+    "ContextManager": (".context_manager", "CONTEXT_MANAGER_AVAILABLE"),
+    "ResponseGenerator": (".response_generator", "RESPONSE_GENERATOR_AVAILABLE"),
+    "DatabaseManager": (".database_manager", "DATABASE_MANAGER_AVAILABLE"),
+    "VoiceProcessor": (".voice_processor", "VOICE_PROCESSOR_AVAILABLE"),
+}
+_component_classes: Dict[str, Any] = {}
 
-try:
-    from .context_manager import ContextManager
-    CONTEXT_MANAGER_AVAILABLE = True
-except ImportError as e:
-    print(f"Context Manager not available: {e}")
-    CONTEXT_MANAGER_AVAILABLE = False
+# (attribute, class name, log label) for the components AICoreEngine builds at startup
+_COMPONENTS = (
+    ("profile_manager", "ProfileManager", "Profile Manager"),
+    ("character_loader", "CharacterLoader", "Character Loader"),
+    ("context_manager", "ContextManager", "Context Manager"),
+    ("response_generator", "ResponseGenerator", "Response Generator"),
+    ("database_manager", "DatabaseManager", "Database Manager"),
+)
 
-try:
-    from .response_generator import ResponseGenerator
-    RESPONSE_GENERATOR_AVAILABLE = True
-except ImportError as e:
-    print(f"Response Generator not available: {e}")
-    RESPONSE_GENERATOR_AVAILABLE = False
+def _load_component(class_name: str):
+    """
+    Import a component class on first use
+    
+    Args:
+        class_name (str): Component class name from _COMPONENT_MODULES
+        
+    Returns:
+        The component class, or None if it cannot be imported
+    """
+    if class_name not in _component_classes:
+        module_name, flag = _COMPONENT_MODULES[class_name]
+        try:
+            # __package__ is empty when this file runs as a script; resolve against core then
+            component_class = getattr(importlib.import_module(module_name, __package__ or "core"), class_name)
+        except ImportError as e:
+            print(f"{class_name} not available: {e}")
+            component_class = None
+        _component_classes[class_name] = component_class
+        globals()[flag] = component_class is not None
+    return _component_classes[class_name]
+
+# Local-time ISO 8601 format for response timestamps (time.strftime is C-level)
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Immutable snapshot of the loaded profile/character, replaced in a single assignment
+EngineState = namedtuple("EngineState", ["profile_id", "character_id", "is_initialized"])
 
-try:
-    from .database_manager import DatabaseManager
-    DATABASE_MANAGER_AVAILABLE = True
-except ImportError as e:
-    print(f"Database Manager not available: {e}")
-    DATABASE_MANAGER_AVAILABLE = False
+# Intent keywords, matched as substrings of the lowercased input; built once and read-only
+_INTENT_KEYWORDS = MappingProxyType({
+    "greeting": ("merhaba", "selam", "hello", "hi", "günaydın", "iyi akşamlar", "merhabalar"),
+    "farewell": ("hoşça kal", "görüşürüz", "bye", "goodbye", "kendine iyi bak", "görüşmek dileğiyle"),
+    "question": ("ne", "nasıl", "neden", "kim", "nerede", "hangi", "?", "mı", "mi", "mıdır", "midir", "nedir"),
+    "command": ("aç", "kapat", "başlat", "dur", "yap", "oluştur", "sil", "temizle", "ayarla"),
+    "time_query": ("saat", "zaman", "tarih", "gün", "time", "date", "now", "bugün", "yarın", "dün", "salı", "çarşamba"),
+    "help": ("yardım", "help", "destek", "support", "yardımcı", "ne yapabilirim", "nasıl kullanılır"),
+    "personal_info": ("adım", "ismim", "name", "my name", "benim adım", "ismin ne", "adın ne"),
+    "wellbeing": ("naber", "nasılsın", "ne haber", "how are you", "iyi misin", "durumun nasıl"),
+    "reminder": ("hatırlat", "anımsat", "bilgilendir", "bildir", "alarm", "timer", "remember"),
+    "calculation": ("hesapla", "topla", "çıkar", "çarp", "böl", "calculate", "plus", "minus", "times", "divide"),
+    "search": ("ara", "bul", "arama", "search", "lookup", "find", "google")
+})
 
-try:
-    from .voice_processor import VoiceProcessor
-    VOICE_PROCESSOR_AVAILABLE = True
-except ImportError as e:
-    print(f"Voice Processor not available: {e}")
-    VOICE_PROCESSOR_AVAILABLE = False
+# One compiled alternation per intent; the lookahead makes findall report the longest
+# keyword starting at every position of the input
+_INTENT_PATTERNS = {
+    intent_type: re.compile("(?=(%s))" % "|".join(
+        re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)
+    ))
+    for intent_type, keywords in _INTENT_KEYWORDS.items()
+}
+
+# Keywords implied by a match: any shorter keyword contained in the matched one
+# (e.g. "ne" inside "nedir") is present too, so the count equals a per-keyword scan
+_INTENT_IMPLIED = {
+    intent_type: {
+        keyword: frozenset(other for other in keywords if other in keyword)
+        for keyword in keywords
+    }
+    for intent_type, keywords in _INTENT_KEYWORDS.items()
+}
+
+# Confidence denominators, one per intent
+_INTENT_SIZES = {intent_type: len(keywords) for intent_type, keywords in _INTENT_KEYWORDS.items()}
+
+@lru_cache(maxsize=2048)
+def _analyze_intent_cached(text: str) -> tuple:
+    """
+    Score intents for a text; repeated inputs are answered from the cache
     
+    Args:
+        text (str): User input text
+        
+    Returns:
+        tuple: (primary, detected intents, (intent, score) pairs, text length, word count, has question mark)
+    """
+    text_lower = text.lower()
+    
+    detected_intents = []
+    confidence_scores = []
+    primary_intent = None
+    best_score = 0.0
+    
+    for intent_type, pattern in _INTENT_PATTERNS.items():
+        found = pattern.findall(text_lower)
+        if found:
+            implied = _INTENT_IMPLIED[intent_type]
+            match_count = len(set().union(*(implied[keyword] for keyword in found)))
+            size = _INTENT_SIZES[intent_type]
+            score = match_count / size if match_count < size else 1.0
+            detected_intents.append(intent_type)
+            confidence_scores.append((intent_type, score))
+            # Strictly greater keeps the first intent on ties, like max()
+            if score > best_score:
+                primary_intent = intent_type
+                best_score = score
+    
+    return (primary_intent, tuple(detected_intents), tuple(confidence_scores),
+            len(text), len(text.split()), "?" in text)
+
+# Keyword buckets for the fallback responder, scanned in one pass; each match
+# reports its bucket through the named group
+_SIMPLE_RESPONSE_KEYWORDS = {
+    "greeting": ["merhaba", "hello", "hi", "günaydın"],
+    "greeting_tr": ["selam"],
+    "meeting": ["meeting", "appointment", "schedule", "toplantı"],
+    "time": ["saat", "time", "now", "zaman"],
+    "help": ["yardım", "help", "destek"],
+    "recall": ["adım neydi", "what was my name", "hatırlıyor musun"],
+}
+_SIMPLE_RESPONSE_PATTERN = re.compile("(?=%s)" % "|".join(
+    "(?P<%s>%s)" % (kind, "|".join(re.escape(keyword) for keyword in keywords))
+    for kind, keywords in _SIMPLE_RESPONSE_KEYWORDS.items()
+))
+
 class AICoreEngine:
     """Enhanced AI Engine with Database Integration"""
     
+    __slots__ = (
+        "logger", "session_id", "start_time", "is_warm", "current_state",
+        "profile_manager", "character_loader", "context_manager", "response_generator",
+        "database_manager", "voice_processor",
+        "current_profile", "current_character", "is_initialized", "processing_stats",
+        "_profile_view", "_is_corporate", "_metric_buffer", "_metric_lock", "_stat_cache",
+        "_response_times", "_last_metrics"
+    )
+    
     def __init__(self, session_id: str = "default_session"):
         self.setup_logging()
         self.logger.info("AICoreEngine initializing...")
         self.session_id = session_id
         self.start_time = time.time()
-        
+        self.is_warm = False
+        self.current_state = EngineState(None, None, False)
+        # Metrics are buffered and written in one batch by flush_metrics()
+        self._metric_buffer = []
+        self._metric_lock = threading.Lock()
+        # Slow component statistics for get_status, keyed by name: (computed_at, value)
+        self._stat_cache = {}
+        
+        # Core components, each optional
+        for attr_name, class_name, label in _COMPONENTS:
+            component_class = _load_component(class_name)
+            component = None
+            if component_class:
+                try:
+                    component = component_class()
+                    self.logger.info("✅ %s loaded", label)
+                except Exception as e:
+                    self.logger.error("%s init error: %s", label, e)
+            else:
+                self.logger.warning("⚠️  %s not available", label)
+            setattr(self, attr_name, component)
         
         # Voice processor
-        if VOICE_PROCESSOR_AVAILABLE:
+        voice_processor_class = _load_component("VoiceProcessor")
+        if voice_processor_class:
             try:
-                self.voice_processor = VoiceProcessor()
+                self.voice_processor = voice_processor_class()
                 # Set callbacks
                 self.voice_processor.set_speech_callback(self._handle_voice_input)
                 self.voice_processor.set_error_callback(self._handle_voice_error)
                 self.logger.info("✅ Voice Processor loaded")
             except Exception as e:
-                self.logger.error(f"Voice Processor init error: {e}")
+                self.logger.error("Voice Processor init error: %s", e)
                 self.voice_processor = None
         else:
             self.voice_processor = None
             self.logger.warning("⚠️  Voice Processor not available")
+        
+        self.current_profile = None
+        self.current_character = None
+        self.is_initialized = False
+        # (profile_id, profile_name, character_id, character_name), resolved once per initialize()
+        self._profile_view = ("unknown", "Unknown", "unknown", "Unknown")
+        self._is_corporate = False
+        self.processing_stats = {
+            "total_requests": 0,
+            "average_response_time": 0
+        }
+        # Recent response times (seconds) for tail-latency reporting
+        self._response_times = deque(maxlen=1024)
+        # (intent, generation, storage) seconds of the last successful request
+        self._last_metrics = None
+        
+        # Record initialization time
+        init_duration = time.time() - self.start_time
+        self._record_metric("initialization_time_ms", init_duration * 1000, "startup")
+        
+        self.logger.info("AICoreEngine initialized")
+    
+    def warm_up(self):
+        """Run first-call code paths once so the first real request does not pay for them"""
+        self._analyze_intent("warmup")
+        self.get_status()
+        self.is_warm = True
     
     def _handle_voice_input(self, text: str):
         """Handle voice input from VoiceProcessor"""
         try:
-            self.logger.info(f"🎤 Voice input received: '{text}'")
+            self.logger.info("Voice input received: '%s'", text)
             
             # Process the voice input
             result = self.process_input(text)
@@ -90,13 +253,13 @@ class AICoreEngine:
                 self.voice_processor.speak(result['response'])
                 
         except Exception as e:
-            self.logger.error(f"Error handling voice input: {e}")
+            self.logger.error("Error handling voice input: %s", e)
             if self.voice_processor:
                 self.voice_processor.speak("Sorry, I encountered an error processing your request.")
     
     def _handle_voice_error(self, error_message: str):
         """Handle voice processing errors"""
-        self.logger.error(f"🎤 Voice error: {error_message}")
+        self.logger.error("Voice error: %s", error_message)
         # Optionally speak the error
         if self.voice_processor:
             self.voice_processor.speak(f"Voice error: {error_message}")
@@ -139,97 +302,6 @@ class AICoreEngine:
         
         return self.voice_processor.speak(text, blocking)
     
-    # get_status metodunu da güncelleyin
-    def get_status(self) -> Dict[str, Any]:
-        status = {
-            # ... mevcut kod ...
-        }
-        
-        # Add voice processor status if available
-        if self.voice_processor:
-            try:
-                voice_status = self.voice_processor.get_status()
-                status["voice_processor"] = voice_status
-            except Exception as e:
-                self.logger.debug(f"Could not get voice processor status: {e}")
-        
-        return status
-        
-        # Profile manager
-        if PROFILE_MANAGER_AVAILABLE:
-            try:
-                self.profile_manager = ProfileManager()
-                self.logger.info("✅ Profile Manager loaded")
-            except Exception as e:
-                self.logger.error(f"Profile Manager init error: {e}")
-                self.profile_manager = None
-        else:
-            self.profile_manager = None
-            self.logger.warning("⚠️  Profile Manager not available")
-        
-        # Character loader
-        if CHARACTER_LOADER_AVAILABLE:
-            try:
-                self.character_loader = CharacterLoader()
-                self.logger.info("✅ Character Loader loaded")
-            except Exception as e:
-                self.logger.error(f"Character Loader init error: {e}")
-                self.character_loader = None
-        else:
-            self.character_loader = None
-            self.logger.warning("⚠️  Character Loader not available")
-        
-        # Context manager
-        if CONTEXT_MANAGER_AVAILABLE:
-            try:
-                self.context_manager = ContextManager()
-                self.logger.info("✅ Context Manager loaded")
-            except Exception as e:
-                self.logger.error(f"Context Manager init error: {e}")
-                self.context_manager = None
-        else:
-            self.context_manager = None
-            self.logger.warning("⚠️  Context Manager not available")
-        
-        # Response generator
-        if RESPONSE_GENERATOR_AVAILABLE:
-            try:
-                self.response_generator = ResponseGenerator()
-                self.logger.info("✅ Response Generator loaded")
-            except Exception as e:
-                self.logger.error(f"Response Generator init error: {e}")
-                self.response_generator = None
-        else:
-            self.response_generator = None
-            self.logger.warning("⚠️  Response Generator not available")
-        
-        # Database manager
-        if DATABASE_MANAGER_AVAILABLE:
-            try:
-                self.database_manager = DatabaseManager()
-                self.logger.info("✅ Database Manager loaded")
-            except Exception as e:
-                self.logger.error(f"Database Manager init error: {e}")
-                self.database_manager = None
-        else:
-            self.database_manager = None
-            self.logger.warning("⚠️  Database Manager not available")
-        
-        self.current_profile = None
-        self.current_character = None
-        self.is_initialized = False
-        self.processing_stats = {
-            "total_requests": 0,
-            "total_processing_time": 0,
-            "average_response_time": 0
-        }
-        
-        # Record initialization time
-        init_duration = time.time() - self.start_time
-        self._record_metric("initialization_time_ms", init_duration * 1000, "startup")
-        
-        self.logger.info("AICoreEngine initialized")
-    
     def setup_logging(self):
         """Setup logging"""
         self.logger = logging.getLogger('AICoreEngine')
@@ -251,22 +323,26 @@ class AICoreEngine:
         Returns:
             bool: Initialization success
         """
-        init_start = time.time()
+        # Already loaded: nothing to re-fetch, validate or log
+        state = self.current_state
+        if state.is_initialized and state.profile_id == profile_id and state.character_id == character_id:
+            return True
+        
+        init_start = time.perf_counter()
         
         try:
             # Load profile
             if self.profile_manager:
                 profile = self.profile_manager.get_profile(profile_id)
                 if profile:
-                    self.current_profile = profile
-                    self.logger.info(f"✅ Profile loaded: {profile_id}")
+                    self.logger.info("Profile loaded: %s", profile_id)
                 else:
-                    self.logger.error(f"❌ Profile not found: {profile_id}")
+                    self.logger.error("Profile not found: %s", profile_id)
                     return False
             else:
                 # Fallback
-                self.current_profile = {"id": profile_id, "name": profile_id}
-                self.logger.info(f"⚠️  Using fallback profile: {profile_id}")
+                profile = {"id": profile_id, "name": profile_id}
+                self.logger.info("Using fallback profile: %s", profile_id)
             
             # Load character
             if self.character_loader:
@@ -274,84 +350,89 @@ class AICoreEngine:
                 if character:
                     # Compatibility check
                     if self.profile_manager:
-                        is_compatible = self.character_loader.validate_character_compatibility(
-                            character_id, profile_id
-                        )
-                        if not is_compatible:
+                        # A set lookup in the loader's index, which follows character reloads
+                        if not self.character_loader.validate_character_compatibility(character_id, profile_id):
                             self.logger.warning(
-                                f"⚠️  Character {character_id} may not be compatible with profile {profile_id}"
+                                "Character %s may not be compatible with profile %s", character_id, profile_id
                             )
                     
-                    self.current_character = character
-                    self.logger.info(f"✅ Character loaded: {character_id}")
+                    self.logger.info("Character loaded: %s", character_id)
                 else:
-                    self.logger.error(f"❌ Character not found: {character_id}")
+                    self.logger.error("Character not found: %s", character_id)
                     return False
             else:
                 # Fallback
-                self.current_character = {"id": character_id, "name": character_id}
-                self.logger.info(f"⚠️  Using fallback character: {character_id}")
+                character = {"id": character_id, "name": character_id}
+                self.logger.info("Using fallback character: %s", character_id)
             
+            # Swap profile and character in together so readers never see a half-switched engine
+            self.current_profile = profile
+            self.current_character = character
             self.is_initialized = True
+            self.current_state = EngineState(profile_id, character_id, True)
+            self._profile_view = (
+                profile.get('id', 'unknown'), self._display_name(profile),
+                character.get('id', 'unknown'), self._display_name(character)
+            )
+            self._is_corporate = character.get('id') == 'corporate'
             
             # Record initialization metrics
-            init_duration = time.time() - init_start
+            init_duration = time.perf_counter() - init_start
             self._record_metric("profile_load_time_ms", init_duration * 1000, "initialization")
+            self.flush_metrics()
             
-            self.logger.info(f"✅ Engine initialized with profile '{profile_id}' and character '{character_id}'")
+            self.logger.info("Engine initialized with profile '%s' and character '%s'", profile_id, character_id)
             return True
                 
         except Exception as e:
-            self.logger.error(f"Initialization error: {e}")
+            self.logger.error("Initialization error: %s", e)
             return False
     
-    def process_input(self, user_input: str) -> Dict[str, Any]:
+    @staticmethod
+    def _display_name(entity: Dict[str, Any]) -> str:
+        """Resolve the Turkish display name of a profile or character"""
+        name_info = entity.get('name', {})
+        return name_info.get('tr', name_info) if isinstance(name_info, dict) else str(name_info)
+    
+    def process_input(self, user_input: str, include_metrics: bool = False) -> Dict[str, Any]:
         """
         Process user input and return response with full database integration
         
         Args:
             user_input (str): User input text
+            include_metrics (bool): Whether to add per-stage timings to the response
             
         Returns:
             Dict: Response with text, confidence and metadata
         """
-        process_start = time.time()
+        process_start = time.perf_counter()
         self.processing_stats["total_requests"] += 1
         
         try:
             # Get profile and character info
-            profile_name = "Unknown"
-            character_name = "Unknown"
-            profile_id = "unknown"
-            character_id = "unknown"
-            
-            if self.current_profile:
-                profile_info = self.current_profile.get('name', {})
-                profile_name = profile_info.get('tr', profile_info) if isinstance(profile_info, dict) else str(profile_info)
-                profile_id = self.current_profile.get('id', 'unknown')
-            
-            if self.current_character:
-                character_info = self.current_character.get('name', {})
-                character_name = character_info.get('tr', character_info) if isinstance(character_info, dict) else str(character_info)
-                character_id = self.current_character.get('id', 'unknown')
+            profile_id, profile_name, character_id, character_name = self._profile_view
             
-            self.logger.info(f"Processing input - Profile: '{profile_name}', Character: '{character_name}' - Input: {user_input}")
+            self.logger.info(
+                "Processing input - Profile: '%s', Character: '%s' - Input: %s",
+                profile_name, character_name, user_input
+            )
             
             # Get context
             context = []
             if self.context_manager:
                 context = self.context_manager.get_context(self.session_id, user_input)
-                self.logger.debug(f"Retrieved {len(context)} context items")
+                self.logger.debug("Retrieved %d context items", len(context))
             
             # Analyze intent
-            intent_analysis_start = time.time()
+            intent_analysis_start = time.perf_counter()
             intent_analysis = self._analyze_intent(user_input)
-            intent_duration = time.time() - intent_analysis_start
+            response_generation_start = time.perf_counter()
+            intent_duration = response_generation_start - intent_analysis_start
             self._record_metric("intent_analysis_time_ms", intent_duration * 1000, "processing")
-            self.logger.debug(f"Intent analysis: {intent_analysis}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Intent analysis: %r", intent_analysis)
             
             # Generate response using ResponseGenerator
-            response_generation_start = time.time()
             response_data = None
             if self.response_generator:
                 response_data = self.response_generator.generate_response(
@@ -361,7 +442,7 @@ class AICoreEngine:
                     character=self.current_character,
                     profile=self.current_profile
                 )
-                self.logger.debug(f"Generated response with type: {response_data.get('type', 'unknown')}")
+                self.logger.debug("Generated response with type: %s", response_data.get('type', 'unknown'))
             else:
                 # Fallback to simple response generation
                 response_text = self._generate_simple_response(user_input, context)
@@ -371,66 +452,74 @@ class AICoreEngine:
                     "type": "simple_fallback"
                 }
             
-            response_generation_duration = time.time() - response_generation_start
+            storage_start = time.perf_counter()
+            response_generation_duration = storage_start - response_generation_start
             self._record_metric("response_generation_time_ms", response_generation_duration * 1000, "processing")
             
-            # Store interaction in context manager with metrics
-            storage_start = time.time()
+            # Store interaction in context manager
             if self.context_manager and response_data:
-                processing_time_ms = int((time.time() - process_start) * 1000)
                 self.context_manager.store_interaction(
                     session_id=self.session_id,
                     user_input=user_input,
                     ai_response=response_data["text"],
                     intent=intent_analysis,
                     profile_id=profile_id,
-                    character_id=character_id,
-                    processing_time_ms=processing_time_ms
+                    character_id=character_id
                 )
                 self.logger.debug("Stored interaction in context manager")
             
-            storage_duration = time.time() - storage_start
+            process_end = time.perf_counter()
+            storage_duration = process_end - storage_start
             self._record_metric("storage_time_ms", storage_duration * 1000, "processing")
             
             # Calculate total processing time
-            total_processing_time = time.time() - process_start
-            self.processing_stats["total_processing_time"] += total_processing_time
+            total_processing_time = process_end - process_start
+            # Running mean avoids summing every request into an ever-growing total
+            average = self.processing_stats["average_response_time"]
             self.processing_stats["average_response_time"] = (
-                self.processing_stats["total_processing_time"] / self.processing_stats["total_requests"]
+                average + (total_processing_time - average) / self.processing_stats["total_requests"]
             )
+            self._response_times.append(total_processing_time)
             
             # Record performance metrics
             self._record_metric("total_processing_time_ms", total_processing_time * 1000, "performance")
             self._record_metric("response_confidence", response_data["confidence"], "quality")
+            self.flush_metrics()
             
-            return {
+            # Raw stage timings (seconds) stay available even when not returned
+            self._last_metrics = (intent_duration, response_generation_duration, storage_duration)
+            
+            result = {
                 "response": response_data["text"],
                 "confidence": response_data["confidence"],
                 "response_type": response_data["type"],
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": time.strftime(_TIMESTAMP_FORMAT),
                 "status": "success",
                 "profile": profile_id,
                 "character": character_id,
                 "context_items": len(context) if context else 0,
-                "processing_time_ms": int(total_processing_time * 1000),
-                "metrics": {
+                "processing_time_ms": int(total_processing_time * 1000)
+            }
+            if include_metrics:
+                result["metrics"] = {
                     "intent_analysis_time_ms": int(intent_duration * 1000),
                     "response_generation_time_ms": int(response_generation_duration * 1000),
                     "storage_time_ms": int(storage_duration * 1000)
                 }
-            }
+            return result
         except Exception as e:
-            self.logger.error(f"Error: {str(e)}")
+            self.logger.error("Error: %s", e)
             
             # Record error metrics
-            error_duration = time.time() - process_start
+            error_duration = time.perf_counter() - process_start
             self._record_metric("error_processing_time_ms", error_duration * 1000, "errors")
+            self.flush_metrics()
             
             return {
                 "response": "Bir hata oluştu",
                 "confidence": 0.0,
                 "response_type": "error",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": time.strftime(_TIMESTAMP_FORMAT),
                 "status": "error",
                 "error": str(e),
                 "processing_time_ms": int(error_duration * 1000)
@@ -438,7 +527,7 @@ class AICoreEngine:
     
     def _record_metric(self, metric_name: str, metric_value: float, category: str = "general"):
         """
-        Record system metrics using DatabaseManager
+        Buffer a system metric for the next flush_metrics()
         
         Args:
             metric_name (str): Metric name
@@ -446,54 +535,37 @@ class AICoreEngine:
             category (str): Metric category
         """
         if self.database_manager:
+            with self._metric_lock:
+                self._metric_buffer.append((metric_name, metric_value, category, self.session_id))
+    
+    def flush_metrics(self):
+        """Write buffered metrics to the database in a single transaction"""
+        with self._metric_lock:
+            metrics, self._metric_buffer = self._metric_buffer, []
+        if metrics and self.database_manager:
             try:
-                self.database_manager.store_metric(metric_name, metric_value, category, self.session_id)
+                self.database_manager.store_metrics_bulk(metrics)
             except Exception as e:
-                self.logger.debug(f"Metric recording failed: {e}")
+                self.logger.debug("Metric recording failed: %s", e)
     
     def _analyze_intent(self, text: str) -> Dict[str, Any]:
         """Enhanced intent analysis"""
-        text_lower = text.lower()
-        
-        intents = {
-            "greeting": ["merhaba", "selam", "hello", "hi", "günaydın", "iyi akşamlar", "merhabalar"],
-            "farewell": ["hoşça kal", "görüşürüz", "bye", "goodbye", "kendine iyi bak", "görüşmek dileğiyle"],
-            "question": ["ne", "nasıl", "neden", "kim", "nerede", "hangi", "?", "mı", "mi", "mıdır", "midir", "nedir"],
-            "command": ["aç", "kapat", "başlat", "dur", "yap", "oluştur", "sil", "temizle", "ayarla"],
-            "time_query": ["saat", "zaman", "tarih", "gün", "time", "date", "now", "bugün", "yarın", "dün", "salı", "çarşamba"],
-            "help": ["yardım", "help", "destek", "support", "yardımcı", "ne yapabilirim", "nasıl kullanılır"],
-            "personal_info": ["adım", "ismim", "name", "my name", "benim adım", "ismin ne", "adın ne"],
-            "wellbeing": ["naber", "nasılsın", "ne haber", "how are you", "iyi misin", "durumun nasıl"],
-            "reminder": ["hatırlat", "anımsat", "bilgilendir", "bildir", "alarm", "timer", "remember"],
-            "calculation": ["hesapla", "topla", "çıkar", "çarp", "böl", "calculate", "plus", "minus", "times", "divide"],
-            "search": ["ara", "bul", "arama", "search", "lookup", "find", "google"]
-        }
-        
-        detected_intents = []
-        confidence_scores = {}
-        
-        for intent_type, keywords in intents.items():
-            matches = [keyword for keyword in keywords if keyword in text_lower]
-            if matches:
-                detected_intents.append(intent_type)
-                confidence_scores[intent_type] = min(len(matches) / len(keywords), 1.0)
-        
-        primary_intent = None
-        if confidence_scores:
-            primary_intent = max(confidence_scores, key=confidence_scores.get)
-        
+        primary_intent, detected_intents, confidence_scores, text_length, word_count, has_question_mark = (
+            _analyze_intent_cached(text)
+        )
         return {
             "primary": primary_intent,
-            "all_detected": detected_intents,
-            "confidence_scores": confidence_scores,
-            "text_length": len(text),
-            "word_count": len(text.split()),
-            "has_question_mark": "?" in text
+            "all_detected": list(detected_intents),
+            "confidence_scores": dict(confidence_scores),
+            "text_length": text_length,
+            "word_count": word_count,
+            "has_question_mark": has_question_mark
         }
     
     def _generate_simple_response(self, text: str, context: list) -> str:
         """Simple fallback response generation"""
         text_lower = text.lower()
+        kinds = {match.lastgroup for match in _SIMPLE_RESPONSE_PATTERN.finditer(text_lower)}
         
         # Check for personal information in context
         user_name = None
@@ -501,28 +573,28 @@ class AICoreEngine:
             user_name = self.context_manager.get_user_fact(self.session_id, "name")
         
         # Character-based responses
-        if self.current_character and self.current_character.get('id') == 'corporate':
-            if any(word in text_lower for word in ["merhaba", "hello", "hi", "günaydın"]):
+        if self._is_corporate:
+            if "greeting" in kinds:
                 greeting = "Good morning. How may I assist you today?"
                 if user_name:
                     greeting = f"Good morning {user_name}. How may I assist you today?"
                 return greeting
-            elif any(word in text_lower for word in ["meeting", "appointment", "schedule", "toplantı"]):
+            elif "meeting" in kinds:
                 return "I can help schedule meetings. Please provide the date and time."
         else:
-            if any(word in text_lower for word in ["merhaba", "hello", "hi", "selam", "günaydın"]):
+            if "greeting" in kinds or "greeting_tr" in kinds:
                 greeting = "Merhaba! Size nasıl yardımcı olabilirim?"
                 if user_name:
                     greeting = f"Merhaba {user_name}! Size nasıl yardımcı olabilirim?"
                 return greeting
-            elif any(word in text_lower for word in ["saat", "time", "now", "zaman"]):
+            elif "time" in kinds:
                 return f"Şu anda saat: {datetime.now().strftime('%H:%M:%S')}"
-            elif any(word in text_lower for word in ["yardım", "help", "destek"]):
+            elif "help" in kinds:
                 return "Yardım için şu komutları deneyebilirsiniz: merhaba, saat, yardım"
         
         # Context-aware responses
         if context:
-            if any(word in text_lower for word in ["adım neydi", "what was my name", "hatırlıyor musun"]):
+            if "recall" in kinds:
                 if user_name:
                     return f"Adınız {user_name} olarak hatırlıyorum."
                 else:
@@ -545,7 +617,7 @@ class AICoreEngine:
     
     def switch_profile(self, profile_id: str, character_id: str = None) -> bool:
         """Switch to different profile"""
-        switch_start = time.time()
+        switch_start = time.perf_counter()
         
         if character_id is None:
             # If no character specified, use compatible one or default
@@ -561,35 +633,68 @@ class AICoreEngine:
         result = self.initialize(profile_id, character_id)
         
         # Record switch metrics
-        switch_duration = time.time() - switch_start
+        switch_duration = time.perf_counter() - switch_start
         self._record_metric("profile_switch_time_ms", switch_duration * 1000, "operations")
+        self.flush_metrics()
         
         return result
     
     def switch_character(self, character_id: str) -> bool:
         """Switch to different character (keep current profile)"""
-        switch_start = time.time()
-        current_profile_id = self.current_profile.get('id') if self.current_profile else "personal"
+        switch_start = time.perf_counter()
+        current_profile_id = self.current_state.profile_id or "personal"
         result = self.initialize(current_profile_id, character_id)
         
         # Record switch metrics
-        switch_duration = time.time() - switch_start
+        switch_duration = time.perf_counter() - switch_start
         self._record_metric("character_switch_time_ms", switch_duration * 1000, "operations")
+        self.flush_metrics()
         
         return result
     
+    def _cached_stat(self, key: str, ttl: float, func, *args) -> Any:
+        """
+        Return a component statistic, recomputing it at most once per TTL
+        
+        Args:
+            key (str): Cache key
+            ttl (float): Seconds a computed value stays valid
+            func: Callable that computes the statistic
+            
+        Returns:
+            Any: Cached or freshly computed statistic
+        """
+        now = time.monotonic()
+        cached = self._stat_cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        value = func(*args)
+        self._stat_cache[key] = (now, value)
+        return value
+    
+    def _processing_stats_snapshot(self) -> Dict[str, Any]:
+        """Copy processing stats and add p50/p99 response times from recent requests"""
+        stats = dict(self.processing_stats)
+        samples = sorted(self._response_times)
+        if samples:
+            stats["p50_response_time"] = samples[(len(samples) - 1) // 2]
+            stats["p99_response_time"] = samples[int((len(samples) - 1) * 0.99)]
+        return stats
+    
     def get_status(self) -> Dict[str, Any]:
         """Get engine status including all components and database stats"""
+        self.flush_metrics()
+        state = self.current_state
         status = {
-            "ready": self.is_initialized,
-            "current_profile": self.current_profile.get('id') if self.current_profile else None,
-            "current_character": self.current_character.get('id') if self.current_character else None,
+            "ready": state.is_initialized,
+            "current_profile": state.profile_id,
+            "current_character": state.character_id,
             "available_profiles": self.get_available_profiles(),
             "available_characters": self.get_available_characters(),
             "session_id": self.session_id,
             "version": "1.0.0",
             "uptime_seconds": time.time() - self.start_time,
-            "processing_stats": self.processing_stats
+            "processing_stats": self._processing_stats_snapshot()
         }
         
         # Add component statuses
@@ -604,30 +709,50 @@ class AICoreEngine:
         # Add context stats if available
         if self.context_manager:
             try:
-                context_stats = self.context_manager.get_context_stats()
+                context_stats = self._cached_stat("context_stats", 1, self.context_manager.get_context_stats)
                 status["context_stats"] = context_stats
             except Exception as e:
-                self.logger.debug(f"Could not get context stats: {e}")
+                self.logger.debug("Could not get context stats: %s", e)
         
         # Add response generator stats if available
         if self.response_generator:
             try:
-                response_stats = self.response_generator.get_response_statistics()
+                response_stats = self._cached_stat(
+                    "response_stats", 1, self.response_generator.get_response_statistics
+                )
                 status["response_stats"] = response_stats
             except Exception as e:
-                self.logger.debug(f"Could not get response stats: {e}")
+                self.logger.debug("Could not get response stats: %s", e)
         
         # Add database stats if available
         if self.database_manager:
             try:
-                db_stats = self.database_manager.get_database_stats()
+                db_stats = self._cached_stat("database_stats", 10, self.database_manager.get_database_stats)
                 status["database_stats"] = db_stats
                 
-                # Add performance metrics
-                metrics_summary = self.database_manager.get_metrics_summary(hours_back=1)
+                # Add performance metrics (an hour-wide aggregate, so a longer TTL is fine)
+                metrics_summary = self._cached_stat(
+                    "performance_metrics", 30, self.database_manager.get_metrics_summary, None, 1
+                )
                 status["performance_metrics"] = metrics_summary
             except Exception as e:
-                self.logger.debug(f"Could not get database stats: {e}")
+                self.logger.debug("Could not get database stats: %s", e)
+        
+        # Intent cache effectiveness
+        intent_cache = _analyze_intent_cached.cache_info()
+        status["intent_cache"] = {
+            "hits": intent_cache.hits,
+            "misses": intent_cache.misses,
+            "size": intent_cache.currsize
+        }
+        
+        # Add voice processor status if available
+        if self.voice_processor:
+            try:
+                voice_status = self.voice_processor.get_status()
+                status["voice_processor"] = voice_status
+            except Exception as e:
+                self.logger.debug("Could not get voice processor status: %s", e)
         
         return status
 
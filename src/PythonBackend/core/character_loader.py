@@ -4,10 +4,305 @@ Handles loading and managing AI character personalities
 """
 
 import json
+import mmap
 import os
-from typing import Dict, Any, List, Optional
+import sys
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 from pathlib import Path
 import logging
+from collections import ChainMap
+from types import MappingProxyType
+
+try:
+    from .json_loading import ORJSON_AVAILABLE, load_json_files, loads as _loads
+except ImportError:
+    from json_loading import ORJSON_AVAILABLE, load_json_files, loads as _loads
+
+if ORJSON_AVAILABLE:
+    import orjson
+
+# Schema validation for character files when jsonschema is installed
+try:
+    import jsonschema
+    JSONSCHEMA_AVAILABLE = True
+except ImportError:
+    JSONSCHEMA_AVAILABLE = False
+
+# Module-level logger, configured once at import
+logger = logging.getLogger('CharacterLoader')
+logger.setLevel(logging.INFO)
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(name)s - %(levelname)s - %(message)s'))
+    logger.addHandler(_handler)
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _dumps_pretty(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _intern_keys(data: Any) -> Any:
+    """Recursively intern dict keys so all characters share the same key strings
+
+    Args:
+        data (Any): Parsed JSON value
+
+    Returns:
+        Any: Equivalent value whose dict keys are interned
+    """
+    if isinstance(data, dict):
+        return {sys.intern(key): _intern_keys(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_intern_keys(item) for item in data]
+    return data
+
+def _read_character_file(path: str) -> Any:
+    """Read and parse a single character file
+
+    Args:
+        path (str): Path to the character JSON file
+
+    Returns:
+        Any: Parsed character data
+    """
+    # Parse straight from the page cache; empty files fail in mmap and are skipped
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+            memoryview(mapped) as view:
+        return _intern_keys(_loads(view))
+
+_LOCALIZED_TEXT_SCHEMA = {"type": "object", "additionalProperties": {"type": "string"}}
+
+_CHARACTER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string"},
+        "name": _LOCALIZED_TEXT_SCHEMA,
+        "description": _LOCALIZED_TEXT_SCHEMA,
+        "personality_traits": {"type": "object"},
+        "communication_style": {"type": "object"},
+        "voice_settings": {"type": "object"},
+        "capabilities": {"type": "object"},
+        "response_templates": {"type": "object"},
+        "profile_compatibility": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+_CHARACTER_VALIDATOR = jsonschema.Draft7Validator(_CHARACTER_SCHEMA) if JSONSCHEMA_AVAILABLE else None
+
+def _validate_character(character_data: Any):
+    """Check parsed character data against the character schema
+
+    Falls back to checking only the fields the loader indexes directly when
+    jsonschema is not installed.
+
+    Args:
+        character_data (Any): Parsed character file contents
+
+    Raises:
+        ValueError: If the data does not describe a valid character
+    """
+    if _CHARACTER_VALIDATOR is not None:
+        error = jsonschema.exceptions.best_match(_CHARACTER_VALIDATOR.iter_errors(character_data))
+        if error is not None:
+            raise ValueError(f"invalid character: {error.message}")
+        return
+    
+    if not isinstance(character_data, dict):
+        raise ValueError("invalid character: expected a JSON object")
+    if not isinstance(character_data.get("id", ""), str):
+        raise ValueError("invalid character: 'id' must be a string")
+    for field in ("name", "description"):
+        if not isinstance(character_data.get(field, {}), dict):
+            raise ValueError(f"invalid character: '{field}' must be an object")
+    compatibility = character_data.get("profile_compatibility", [])
+    if not isinstance(compatibility, list) or not all(isinstance(p, str) for p in compatibility):
+        raise ValueError("invalid character: 'profile_compatibility' must be a list of strings")
+
+def _normalize_character(character_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill in the fields every character is expected to have
+
+    Args:
+        character_data (Dict): Parsed character data, updated in place
+
+    Returns:
+        Dict: The same character data with name, description and
+            profile_compatibility guaranteed present
+    """
+    character_data.setdefault("name", {})
+    character_data.setdefault("description", {})
+    character_data.setdefault("profile_compatibility", [])
+    return character_data
+
+# Built-in characters, created once at import and shared by every loader.
+# Top-level is read-only; nested dicts are shared too and must not be mutated.
+_DEFAULT_CHARACTERS = MappingProxyType({
+    "artemis": {
+        "id": "artemis",
+        "name": {
+            "tr": "Artemis",
+            "en": "Artemis"
+        },
+        "description": {
+            "tr": "Dost canlısı kişisel asistan",
+            "en": "Friendly personal assistant"
+        },
+        "personality_traits": {
+            "friendly": 0.8,
+            "professional": 0.3,
+            "humorous": 0.6,
+            "empathetic": 0.7,
+            "curious": 0.5
+        },
+        "communication_style": {
+            "formality": "casual",
+            "tone": "warm",
+            "response_length": "medium"
+        },
+        "voice_settings": {
+            "engine": "pyttsx3",
+            "voice_gender": "female",
+            "speaking_rate": 200,
+            "volume": 0.8
+        },
+        "capabilities": {
+            "weather_queries": True,
+            "time_date": True,
+            "calculator": True,
+            "web_search": True,
+            "file_operations": False,
+            "email": False
+        },
+        "response_templates": {
+            "greeting": {
+                "tr": "Merhaba! Size nasıl yardımcı olabilirim?",
+                "en": "Hello! How can I help you today?"
+            },
+            "farewell": {
+                "tr": "Görüşmek üzere!",
+                "en": "See you later!"
+            },
+            "help": {
+                "tr": "Size şu konularda yardımcı olabilirim: zaman, hava durumu, temel hesaplamalar",
+                "en": "I can help you with: time, weather, basic calculations"
+            }
+        },
+        "profile_compatibility": ["personal", "education"]
+    },
+    "corporate": {
+        "id": "corporate",
+        "name": {
+            "tr": "Kurumsal Danışman",
+            "en": "Corporate Advisor"
+        },
+        "description": {
+            "tr": "Profesyonel iş ortamı asistanı",
+            "en": "Professional business environment assistant"
+        },
+        "personality_traits": {
+            "friendly": 0.5,
+            "professional": 0.9,
+            "humorous": 0.2,
+            "empathetic": 0.6,
+            "curious": 0.4
+        },
+        "communication_style": {
+            "formality": "formal",
+            "tone": "professional",
+            "response_length": "concise"
+        },
+        "voice_settings": {
+            "engine": "pyttsx3",
+            "voice_gender": "neutral",
+            "speaking_rate": 180,
+            "volume": 0.7
+        },
+        "capabilities": {
+            "weather_queries": True,
+            "time_date": True,
+            "calculator": True,
+            "web_search": True,
+            "file_operations": True,
+            "email": True,
+            "calendar_management": True
+        },
+        "response_templates": {
+            "greeting": {
+                "tr": "Günaydın. Size nasıl yardımcı olabilirim?",
+                "en": "Good morning. How may I assist you?"
+            },
+            "farewell": {
+                "tr": "İyi günler dilerim.",
+                "en": "Have a good day."
+            },
+            "help": {
+                "tr": "Size şu konularda yardımcı olabilirim: toplantı planlama, e-posta yönetimi, dosya işlemleri",
+                "en": "I can assist with: meeting scheduling, email management, file operations"
+            }
+        },
+        "profile_compatibility": ["business"]
+    },
+    "study_buddy": {
+        "id": "study_buddy",
+        "name": {
+            "tr": "Study Buddy",
+            "en": "Study Buddy"
+        },
+        "description": {
+            "tr": "Öğrenciler için eğitim asistanı",
+            "en": "Educational assistant for students"
+        },
+        "personality_traits": {
+            "friendly": 0.7,
+            "professional": 0.4,
+            "humorous": 0.8,
+            "empathetic": 0.9,
+            "curious": 0.9
+        },
+        "communication_style": {
+            "formality": "casual",
+            "tone": "encouraging",
+            "response_length": "detailed"
+        },
+        "voice_settings": {
+            "engine": "pyttsx3",
+            "voice_gender": "neutral",
+            "speaking_rate": 220,
+            "volume": 0.9
+        },
+        "capabilities": {
+            "weather_queries": True,
+            "time_date": True,
+            "calculator": True,
+            "web_search": True,
+            "study_tools": True,
+            "quiz_generation": True,
+            "explanation_assistance": True
+        },
+        "response_templates": {
+            "greeting": {
+                "tr": "Merhaba! Bugün hangi konuyu çalışacağız?",
+                "en": "Hello! What subject shall we study today?"
+            },
+            "farewell": {
+                "tr": "Çalışmalarında başarılar! Görüşürüz!",
+                "en": "Good luck with your studies! See you!"
+            },
+            "help": {
+                "tr": "Size şu konularda yardımcı olabilirim: konu anlatımı, quiz hazırlama, çalışma planı",
+                "en": "I can help with: topic explanation, quiz preparation, study planning"
+            }
+        },
+        "profile_compatibility": ["education"]
+    }
+})
 
 class CharacterLoader:
     """Load and manage AI character definitions"""
@@ -19,225 +314,106 @@ class CharacterLoader:
         Args:
             config_path (str): Path to configuration directory
         """
-        self.logger = self._setup_logger()
         self.config_path = Path(config_path)
         self.characters_dir = self.config_path / "characters"
-        self.characters = {}
-        self.default_characters = self._create_default_characters()
+        self.default_characters = _DEFAULT_CHARACTERS
+        # Dosyadan yüklenen karakterler; varsayılanların üstünde katman olarak durur
+        self._overrides: Dict[str, Any] = {}
+        self.characters = ChainMap(self._overrides, self.default_characters)
+        # profile_id -> uyumlu karakter id'leri (characters sırasıyla)
+        self._compat_index: Dict[str, List[str]] = {}
+        self._universal_chars: List[str] = []
+        # Uyumluluk kontrolü tek küme sorgusuna indirgenir
+        self._universal_set: FrozenSet[str] = frozenset()
+        self._char_profile_pairs: FrozenSet[Tuple[str, str]] = frozenset()
+        self._list_cache: Optional[List[Dict[str, Any]]] = None
+        # character_id -> serialized JSON, filled on demand
+        self._serialized_cache: Dict[str, bytes] = {}
         self._ensure_directories_exist()
         self.load_characters()
-        self.logger.info("CharacterLoader initialized")
-    
-    def _setup_logger(self) -> logging.Logger:
-        """Setup logging for the character loader"""
-        logger = logging.getLogger('CharacterLoader')
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(name)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-        return logger
+        logger.info("CharacterLoader initialized")
     
     def _ensure_directories_exist(self):
         """Ensure required directories exist"""
         self.characters_dir.mkdir(parents=True, exist_ok=True)
     
-    def _create_default_characters(self) -> Dict[str, Any]:
-        """Create default character definitions"""
-        return {
-            "artemis": {
-                "id": "artemis",
-                "name": {
-                    "tr": "Artemis",
-                    "en": "Artemis"
-                },
-                "description": {
-                    "tr": "Dost canlısı kişisel asistan",
-                    "en": "Friendly personal assistant"
-                },
-                "personality_traits": {
-                    "friendly": 0.8,
-                    "professional": 0.3,
-                    "humorous": 0.6,
-                    "empathetic": 0.7,
-                    "curious": 0.5
-                },
-                "communication_style": {
-                    "formality": "casual",
-                    "tone": "warm",
-                    "response_length": "medium"
-                },
-                "voice_settings": {
-                    "engine": "pyttsx3",
-                    "voice_gender": "female",
-                    "speaking_rate": 200,
-                    "volume": 0.8
-                },
-                "capabilities": {
-                    "weather_queries": True,
-                    "time_date": True,
-                    "calculator": True,
-                    "web_search": True,
-                    "file_operations": False,
-                    "email": False
-                },
-                "response_templates": {
-                    "greeting": {
-                        "tr": "Merhaba! Size nasıl yardımcı olabilirim?",
-                        "en": "Hello! How can I help you today?"
-                    },
-                    "farewell": {
-                        "tr": "Görüşmek üzere!",
-                        "en": "See you later!"
-                    },
-                    "help": {
-                        "tr": "Size şu konularda yardımcı olabilirim: zaman, hava durumu, temel hesaplamalar",
-                        "en": "I can help you with: time, weather, basic calculations"
-                    }
-                },
-                "profile_compatibility": ["personal", "education"]
-            },
-            "corporate": {
-                "id": "corporate",
-                "name": {
-                    "tr": "Kurumsal Danışman",
-                    "en": "Corporate Advisor"
-                },
-                "description": {
-                    "tr": "Profesyonel iş ortamı asistanı",
-                    "en": "Professional business environment assistant"
-                },
-                "personality_traits": {
-                    "friendly": 0.5,
-                    "professional": 0.9,
-                    "humorous": 0.2,
-                    "empathetic": 0.6,
-                    "curious": 0.4
-                },
-                "communication_style": {
-                    "formality": "formal",
-                    "tone": "professional",
-                    "response_length": "concise"
-                },
-                "voice_settings": {
-                    "engine": "pyttsx3",
-                    "voice_gender": "neutral",
-                    "speaking_rate": 180,
-                    "volume": 0.7
-                },
-                "capabilities": {
-                    "weather_queries": True,
-                    "time_date": True,
-                    "calculator": True,
-                    "web_search": True,
-                    "file_operations": True,
-                    "email": True,
-                    "calendar_management": True
-                },
-                "response_templates": {
-                    "greeting": {
-                        "tr": "Günaydın. Size nasıl yardımcı olabilirim?",
-                        "en": "Good morning. How may I assist you?"
-                    },
-                    "farewell": {
-                        "tr": "İyi günler dilerim.",
-                        "en": "Have a good day."
-                    },
-                    "help": {
-                        "tr": "Size şu konularda yardımcı olabilirim: toplantı planlama, e-posta yönetimi, dosya işlemleri",
-                        "en": "I can assist with: meeting scheduling, email management, file operations"
-                    }
-                },
-                "profile_compatibility": ["business"]
-            },
-            "study_buddy": {
-                "id": "study_buddy",
-                "name": {
-                    "tr": "Study Buddy",
-                    "en": "Study Buddy"
-                },
-                "description": {
-                    "tr": "Öğrenciler için eğitim asistanı",
-                    "en": "Educational assistant for students"
-                },
-                "personality_traits": {
-                    "friendly": 0.7,
-                    "professional": 0.4,
-                    "humorous": 0.8,
-                    "empathetic": 0.9,
-                    "curious": 0.9
-                },
-                "communication_style": {
-                    "formality": "casual",
-                    "tone": "encouraging",
-                    "response_length": "detailed"
-                },
-                "voice_settings": {
-                    "engine": "pyttsx3",
-                    "voice_gender": "neutral",
-                    "speaking_rate": 220,
-                    "volume": 0.9
-                },
-                "capabilities": {
-                    "weather_queries": True,
-                    "time_date": True,
-                    "calculator": True,
-                    "web_search": True,
-                    "study_tools": True,
-                    "quiz_generation": True,
-                    "explanation_assistance": True
-                },
-                "response_templates": {
-                    "greeting": {
-                        "tr": "Merhaba! Bugün hangi konuyu çalışacağız?",
-                        "en": "Hello! What subject shall we study today?"
-                    },
-                    "farewell": {
-                        "tr": "Çalışmalarında başarılar! Görüşürüz!",
-                        "en": "Good luck with your studies! See you!"
-                    },
-                    "help": {
-                        "tr": "Size şu konularda yardımcı olabilirim: konu anlatımı, quiz hazırlama, çalışma planı",
-                        "en": "I can help with: topic explanation, quiz preparation, study planning"
-                    }
-                },
-                "profile_compatibility": ["education"]
-            }
-        }
-    
-    def load_characters(self) -> Dict[str, Any]:
+    def load_characters(self) -> ChainMap:
         """
         Load characters from JSON files or use defaults
         
         Returns:
-            Dict: Loaded characters dictionary
+            ChainMap: Loaded characters layered over the defaults
         """
         try:
-            # Önce varsayılan karakterleri yükle
-            self.characters = self.default_characters.copy()
+            # Varsayılan karakterler kopyalanmaz, alt katman olarak kullanılır
+            overrides = {}
             
             # Karakter dizinindeki JSON dosyalarını kontrol et
-            if self.characters_dir.exists():
-                for character_file in self.characters_dir.glob("*.json"):
-                    try:
-                        with open(character_file, 'r', encoding='utf-8') as f:
-                            character_data = json.load(f)
-                            character_id = character_data.get('id', character_file.stem)
-                            self.characters[character_id] = character_data
-                            self.logger.info(f"Loaded custom character: {character_id}")
-                    except Exception as e:
-                        self.logger.warning(f"Could not load character {character_file}: {e}")
+            try:
+                with os.scandir(self.characters_dir) as entries:
+                    character_files = [
+                        entry for entry in entries
+                        if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False)
+                    ]
+            except FileNotFoundError:
+                character_files = []
             
-            self.logger.info(f"Loaded {len(self.characters)} characters")
+            # Dosya okuma/parse işlemlerini paralel yap, sözlüğe yazma ana thread'de kalsın
+            paths = [entry.path for entry in character_files]
+            for path, character_data in load_json_files(paths, _read_character_file, logger, "character"):
+                try:
+                    _validate_character(character_data)
+                    character_id = character_data.get('id', os.path.basename(path)[:-len('.json')])
+                    overrides[character_id] = _normalize_character(character_data)
+                    logger.info("Loaded custom character: %s", character_id)
+                except Exception as e:
+                    logger.warning("Could not load character %s: %s", path, e)
+            
+            self._overrides = overrides
+            self.characters = ChainMap(overrides, self.default_characters)
+            self._rebuild_indexes()
+            logger.info("Loaded %d characters", len(self.characters))
             return self.characters
             
         except Exception as e:
-            self.logger.error(f"Error loading characters: {e}")
+            logger.error("Error loading characters: %s", e)
             # En azından varsayılan karakterleri döndür
-            self.characters = self.default_characters
+            self._overrides = {}
+            self.characters = ChainMap(self._overrides, self.default_characters)
+            self._rebuild_indexes()
             return self.characters
     
+    def _rebuild_indexes(self):
+        """Rebuild lookup indexes after self.characters changes"""
+        universal = []
+        profiles = {}
+        pairs = set()
+        for char_id, char_data in self.characters.items():
+            compatibility_list = char_data["profile_compatibility"]
+            if not compatibility_list:
+                universal.append(char_id)
+            for profile_id in compatibility_list:
+                profiles.setdefault(profile_id, None)
+                pairs.add((char_id, profile_id))
+        
+        # Her profil için listeyi karakter sırasını koruyarak önceden hesapla
+        compat_index = {profile_id: [] for profile_id in profiles}
+        for char_id, char_data in self.characters.items():
+            compatibility_list = char_data["profile_compatibility"]
+            targets = compat_index.values() if not compatibility_list else (
+                compat_index[profile_id] for profile_id in compatibility_list
+            )
+            for char_ids in targets:
+                if not char_ids or char_ids[-1] != char_id:
+                    char_ids.append(char_id)
+        
+        self._compat_index = compat_index
+        self._universal_chars = universal
+        self._universal_set = frozenset(universal)
+        self._char_profile_pairs = frozenset(pairs)
+        self._list_cache = None
+        self._serialized_cache = {}
+    
     def load_character(self, character_id: str) -> Optional[Dict[str, Any]]:
         """
         Load specific character by ID
@@ -250,15 +426,15 @@ class CharacterLoader:
         """
         character = self.characters.get(character_id)
         if character:
-            self.logger.info(f"Character loaded: {character_id}")
+            logger.info("Character loaded: %s", character_id)
             return character
         else:
-            self.logger.warning(f"Character not found: {character_id}")
+            logger.warning("Character not found: %s", character_id)
             return None
     
     def get_character(self, character_id: str) -> Optional[Dict[str, Any]]:
         """
-        Get character data (alias for load_character)
+        Get character data without logging (use load_character for logged lookups)
         
         Args:
             character_id (str): Character identifier
@@ -266,7 +442,25 @@ class CharacterLoader:
         Returns:
             Dict or None: Character data
         """
-        return self.load_character(character_id)
+        return self.characters.get(character_id)
+    
+    def get_character_json(self, character_id: str) -> Optional[bytes]:
+        """
+        Get character data as JSON bytes, serialized once and cached
+        
+        Args:
+            character_id (str): Character identifier
+            
+        Returns:
+            bytes or None: UTF-8 JSON of the character, or None if not found
+        """
+        data = self._serialized_cache.get(character_id)
+        if data is None:
+            character = self.characters.get(character_id)
+            if character is None:
+                return None
+            data = self._serialized_cache[character_id] = _dumps(character)
+        return data
     
     def list_characters(self) -> List[Dict[str, Any]]:
         """
@@ -275,15 +469,17 @@ class CharacterLoader:
         Returns:
             List[Dict]: List of character summaries
         """
-        character_list = []
-        for character_id, character_data in self.characters.items():
-            character_list.append({
-                "id": character_id,
-                "name": character_data.get("name", {}),
-                "description": character_data.get("description", {}),
-                "profile_compatibility": character_data.get("profile_compatibility", [])
-            })
-        return character_list
+        if self._list_cache is None:
+            self._list_cache = [
+                {
+                    "id": character_id,
+                    "name": character_data["name"],
+                    "description": character_data["description"],
+                    "profile_compatibility": character_data["profile_compatibility"]
+                }
+                for character_id, character_data in self.characters.items()
+            ]
+        return list(self._list_cache)
     
     def get_character_names(self) -> List[str]:
         """
@@ -292,7 +488,7 @@ class CharacterLoader:
         Returns:
             List[str]: List of character identifiers
         """
-        return list(self.characters.keys())
+        return list(self.characters)
     
     def get_compatible_characters(self, profile_id: str) -> List[str]:
         """
@@ -304,12 +500,7 @@ class CharacterLoader:
         Returns:
             List[str]: List of compatible character IDs
         """
-        compatible_chars = []
-        for char_id, char_data in self.characters.items():
-            compatibility_list = char_data.get("profile_compatibility", [])
-            if profile_id in compatibility_list or not compatibility_list:
-                compatible_chars.append(char_id)
-        return compatible_chars
+        return list(self._compat_index.get(profile_id, self._universal_chars))
     
     def validate_character_compatibility(self, character_id: str, profile_id: str) -> bool:
         """
@@ -322,70 +513,80 @@ class CharacterLoader:
         Returns:
             bool: Compatibility status
         """
-        character = self.get_character(character_id)
-        if not character:
-            return False
-        
-        compatibility_list = character.get("profile_compatibility", [])
-        # Boş liste tüm profillerle uyumlu demektir
-        if not compatibility_list:
-            return True
-        
-        return profile_id in compatibility_list
+        # Boş uyumluluk listesi olan karakterler tüm profillerle uyumludur
+        return (character_id in self._universal_set
+                or (character_id, profile_id) in self._char_profile_pairs)
     
-    def save_character(self, character_id: str, character_data: Dict[str, Any]) -> bool:
+    def save_character(self, character_id: str, character_data: Dict[str, Any],
+                       fsync: bool = True) -> bool:
         """
         Save character to file (future feature)
         
         Args:
             character_id (str): Character identifier
             character_data (Dict): Character data to save
+            fsync (bool): Flush the file to disk before replacing the old one
             
         Returns:
             bool: Success status
         """
+        character_file = self.characters_dir / f"{character_id}.json"
+        temp_file = character_file.with_suffix('.json.tmp')
         try:
-            character_file = self.characters_dir / f"{character_id}.json"
-            with open(character_file, 'w', encoding='utf-8') as f:
-                json.dump(character_data, f, ensure_ascii=False, indent=2)
-            self.logger.info(f"Saved character: {character_id}")
+            data = _dumps_pretty(character_data)
+            # Geçici dosyaya yaz ve yerine taşı; yarıda kalan yazma mevcut dosyayı bozmaz
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_file, character_file)
+            self._list_cache = None
+            self._serialized_cache.pop(character_id, None)
+            logger.info("Saved character: %s", character_id)
             return True
         except Exception as e:
-            self.logger.error(f"Error saving character {character_id}: {e}")
+            logger.error("Error saving character %s: %s", character_id, e)
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
             return False
 
 # Test function
 def test_character_loader():
     """Test Character Loader functionality"""
-    print("🎭 Testing Character Loader...")
+    # Çıktıyı biriktir ve tek seferde yaz
+    lines = ["🎭 Testing Character Loader..."]
     
     # Create loader instance
     cl = CharacterLoader()
     
     # Test character listing
-    print(f"\n📋 Available characters: {cl.get_character_names()}")
+    lines.append(f"\n📋 Available characters: {cl.get_character_names()}")
     
     # Test specific character loading
     artemis = cl.load_character("artemis")
     if artemis:
-        print(f"\n👤 Artemis: {artemis.get('name', {}).get('tr', 'N/A')}")
-        print(f"   Personality: {artemis.get('personality_traits', {})}")
+        lines.append(f"\n👤 Artemis: {artemis['name'].get('tr', 'N/A')}")
+        lines.append(f"   Personality: {artemis.get('personality_traits', {})}")
     
     # Test character listing
     char_list = cl.list_characters()
-    print(f"\n📝 Character List:")
-    for char in char_list:
-        print(f"  - {char['id']}: {char['name'].get('tr', 'N/A')}")
+    lines.append("\n📝 Character List:")
+    lines.extend(f"  - {char['id']}: {char['name'].get('tr', 'N/A')}" for char in char_list)
     
     # Test compatibility
     compatible_with_personal = cl.get_compatible_characters("personal")
-    print(f"\n🤝 Compatible with personal profile: {compatible_with_personal}")
+    lines.append(f"\n🤝 Compatible with personal profile: {compatible_with_personal}")
     
     # Test validation
     is_compatible = cl.validate_character_compatibility("artemis", "personal")
-    print(f"   Artemis-Personal compatibility: {is_compatible}")
+    lines.append(f"   Artemis-Personal compatibility: {is_compatible}")
     
-    print("\n✅ Character Loader test completed!")
+    lines.append("\n✅ Character Loader test completed!")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     test_character_loader()
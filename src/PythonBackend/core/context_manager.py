@@ -3,17 +3,171 @@ Context Manager for Windows AI Assistant
 Handles conversation history, user preferences, and contextual awareness
 """
 
+import atexit
 import json
 import sqlite3
-import hashlib
 import logging
+import queue
+import re
+import threading
+import time
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    from .hashing import interaction_hash
+except ImportError:
+    from hashing import interaction_hash
+
+# Multi-pattern keyword matching for fact extraction when pyahocorasick is installed
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Buffered conversation writes: flushed every interval or once the batch fills up
+INTERACTION_BATCH_SIZE = 64
+INTERACTION_FLUSH_INTERVAL = 0.2  # seconds
+INTERACTION_QUEUE_SIZE = 10000
+
+# Read-through cache for preference/fact lookups
+READ_CACHE_SIZE = 4096
+_MISSING = object()
+
+# Context stats are not realtime-critical
+CONTEXT_STATS_TTL = 5  # seconds
+
+# UPDATE ... RETURNING needs SQLite 3.35+
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Fact extraction keywords -> tag, matched case-insensitively against the user input
+_FACT_KEYWORDS = {
+    "adım": "name",
+    "benim adım": "name",
+    "my name is": "name",
+    "beğen": "like",
+    "like": "like",
+    "müzik": "music",
+    "music": "music",
+    "spor": "sports",
+    "sports": "sports",
+}
+
+if AHOCORASICK_AVAILABLE:
+    _FACT_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _tag in _FACT_KEYWORDS.items():
+        _FACT_AUTOMATON.add_word(_keyword, _tag)
+    _FACT_AUTOMATON.make_automaton()
+else:
+    # Lookahead finds a match at every position, so overlapping keywords are not lost.
+    # IGNORECASE avoids a lowered copy of the input; one named group per tag.
+    _FACT_TAGS = {}
+    for _keyword, _tag in _FACT_KEYWORDS.items():
+        _FACT_TAGS.setdefault(_tag, []).append(_keyword)
+    _FACT_PATTERN = re.compile(
+        "(?=" + "|".join(
+            f"(?P<{tag}>" + "|".join(map(re.escape, sorted(keywords, key=len, reverse=True))) + ")"
+            for tag, keywords in _FACT_TAGS.items()
+        ) + ")",
+        re.IGNORECASE
+    )
+
+def _scan_fact_keywords(text: str) -> set:
+    """
+    Find which fact keyword tags occur in text in a single pass
+    
+    Args:
+        text (str): User input, in any case
+        
+    Returns:
+        set: Tags of all matched keywords
+    """
+    if AHOCORASICK_AVAILABLE:
+        return {tag for _, tag in _FACT_AUTOMATON.iter(text.lower())}
+    return {match.lastgroup for match in _FACT_PATTERN.finditer(text)}
+
 class ContextManager:
     """Manage conversation context and user preferences"""
     
+    # Hot statements kept as constants so the connection's statement cache reuses them
+    _SQL_INSERT_HISTORY = '''
+        INSERT INTO conversation_history
+        (session_id, user_input, ai_response, context_hash, profile_id, character_id)
+        VALUES (?, ?, ?, ?, ?, ?)
+    '''
+    _SQL_SELECT_CONTEXT = '''
+        SELECT user_input, ai_response, timestamp, profile_id, character_id
+        FROM conversation_history
+        WHERE session_id = ?
+        ORDER BY timestamp DESC
+        LIMIT ?
+    '''
+    _SQL_SELECT_RECENT_CONTEXT = '''
+        SELECT session_id, user_input, ai_response, timestamp, profile_id, character_id
+        FROM conversation_history
+        WHERE timestamp > ?
+        ORDER BY timestamp DESC
+        LIMIT ?
+    '''
+    _SQL_UPSERT_PREFERENCE = '''
+        INSERT OR REPLACE INTO user_preferences
+        (user_id, preference_key, preference_value, last_updated)
+        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+    '''
+    _SQL_SELECT_PREFERENCE = '''
+        SELECT preference_value FROM user_preferences
+        WHERE user_id = ? AND preference_key = ?
+        ORDER BY last_updated DESC
+        LIMIT 1
+    '''
+    _SQL_SELECT_ALL_PREFERENCES = '''
+        SELECT preference_key, preference_value FROM user_preferences
+        WHERE user_id = ?
+        ORDER BY last_updated DESC
+    '''
+    _SQL_UPSERT_USER_FACT = '''
+        INSERT OR REPLACE INTO user_facts
+        (user_id, fact_key, fact_value, confidence, created_at, last_confirmed)
+        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+    '''
+    _SQL_SELECT_USER_FACT = '''
+        SELECT fact_value, confidence FROM user_facts
+        WHERE user_id = ? AND fact_key = ?
+        ORDER BY last_confirmed DESC
+        LIMIT 1
+    '''
+    _SQL_UPSERT_LEARNED_FACT = '''
+        INSERT OR REPLACE INTO learned_facts
+        (fact_key, fact_value, confidence, source, created_at, last_used)
+        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+    '''
+    _SQL_SELECT_LEARNED_FACT = '''
+        SELECT fact_value, confidence FROM learned_facts
+        WHERE fact_key = ?
+        ORDER BY last_used DESC
+        LIMIT 1
+    '''
+    _SQL_FETCH_AND_TOUCH_LEARNED_FACT = '''
+        UPDATE learned_facts SET last_used = CURRENT_TIMESTAMP
+        WHERE fact_key = ?
+        RETURNING fact_value, confidence
+    '''
+    _SQL_TOUCH_LEARNED_FACT = '''
+        UPDATE learned_facts SET last_used = CURRENT_TIMESTAMP
+        WHERE fact_key = ?
+    '''
+    _SQL_CONTEXT_STATS = '''
+        SELECT
+            (SELECT COUNT(*) FROM conversation_history),
+            (SELECT COUNT(DISTINCT session_id) FROM conversation_history),
+            (SELECT COUNT(*) FROM user_preferences),
+            (SELECT COUNT(*) FROM learned_facts)
+    '''
+    _SQL_DELETE_SESSION = '''
+        DELETE FROM conversation_history WHERE session_id = ?
+    '''
+    
     def __init__(self, db_path: str = "../databases/context.db"):
         """
         Initialize Context Manager
@@ -24,7 +178,28 @@ class ContextManager:
         self.logger = self._setup_logger()
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One persistent connection, guarded by a lock since the engine calls in from several threads
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        # Rows are built in C and support access by column name
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        # (table, key...) -> value; write methods keep it up to date
+        self._read_cache: Dict[tuple, Optional[str]] = {}
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cached_at = 0.0
         self._initialize_database()
+        
+        # store_interaction rows collect here and the background thread writes them in batches
+        self._pending_interactions = queue.Queue(maxsize=INTERACTION_QUEUE_SIZE)
+        # Learned facts served from the read cache still get their last_used bumped here
+        self._pending_touches = queue.SimpleQueue()
+        self._flush_event = threading.Event()
+        self._closed = False
+        self._writer_thread = threading.Thread(
+            target=self._interaction_writer, name="ContextManagerWriter", daemon=True
+        )
+        self._writer_thread.start()
+        atexit.register(self.close)
         self.logger.info("ContextManager initialized")
     
     def _setup_logger(self) -> logging.Logger:
@@ -38,71 +213,195 @@ class ContextManager:
         logger.setLevel(logging.INFO)
         return logger
     
+    def close(self):
+        """Flush pending writes, stop the writer thread and close the database connection"""
+        if self._closed:
+            return
+        self._closed = True
+        self._flush_event.set()
+        self._writer_thread.join()
+        self._flush_pending_interactions()
+        self._flush_pending_touches()
+        with self._lock:
+            self._conn.close()
+        atexit.unregister(self.close)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def _initialize_database(self):
         """Initialize SQLite database with required tables"""
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            # Conversation history table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS conversation_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id TEXT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    user_input TEXT,
-                    ai_response TEXT,
-                    context_hash TEXT,
-                    profile_id TEXT,
-                    character_id TEXT
-                )
-            ''')
-            
-            # User preferences table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_preferences (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT,
-                    preference_key TEXT,
-                    preference_value TEXT,
-                    last_updated DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Learned facts table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS learned_facts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    fact_key TEXT UNIQUE,
-                    fact_value TEXT,
-                    confidence REAL,
-                    source TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    last_used DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # User facts table (personal information)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_facts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT,
-                    fact_key TEXT,
-                    fact_value TEXT,
-                    confidence REAL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    last_confirmed DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
+            with self._lock:
+                cursor = self._conn.cursor()
+                
+                # Conversation history table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS conversation_history (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        session_id TEXT,
+                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        user_input TEXT,
+                        ai_response TEXT,
+                        context_hash TEXT,
+                        profile_id TEXT,
+                        character_id TEXT
+                    )
+                ''')
+                
+                # User preferences table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS user_preferences (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        user_id TEXT,
+                        preference_key TEXT,
+                        preference_value TEXT,
+                        last_updated DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                # Learned facts table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS learned_facts (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        fact_key TEXT UNIQUE,
+                        fact_value TEXT,
+                        confidence REAL,
+                        source TEXT,
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        last_used DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                # User facts table (personal information)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS user_facts (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        user_id TEXT,
+                        fact_key TEXT,
+                        fact_value TEXT,
+                        confidence REAL,
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        last_confirmed DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                # Indexes for session history, recent context and key lookups
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_conv_session_ts
+                    ON conversation_history(session_id, timestamp DESC)
+                ''')
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_conv_ts
+                    ON conversation_history(timestamp DESC)
+                ''')
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_pref_user_key
+                    ON user_preferences(user_id, preference_key, last_updated DESC)
+                ''')
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_userfacts
+                    ON user_facts(user_id, fact_key, last_confirmed DESC)
+                ''')
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_learned_facts_key
+                    ON learned_facts(fact_key, last_used DESC)
+                ''')
+                
+                # WAL: readers are not blocked by writes and commits do not fsync every time
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.execute("PRAGMA cache_size=-20000")  # ~20 MB
+                cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
             
-            conn.commit()
-            conn.close()
             self.logger.info("✅ Database initialized successfully")
             
         except Exception as e:
             self.logger.error(f"❌ Database initialization error: {e}")
             raise
     
+    def _cache_put(self, cache_key: tuple, value: Optional[str]):
+        """Store a lookup result, evicting the oldest entry when full"""
+        with self._lock:
+            self._read_cache.pop(cache_key, None)
+            if len(self._read_cache) >= READ_CACHE_SIZE:
+                del self._read_cache[next(iter(self._read_cache))]
+            self._read_cache[cache_key] = value
+    
+    def _interaction_writer(self):
+        """Background loop that writes buffered interactions in batches"""
+        while not self._closed:
+            self._flush_event.wait(INTERACTION_FLUSH_INTERVAL)
+            self._flush_event.clear()
+            self._flush_pending_interactions()
+            self._flush_pending_touches()
+    
+    def _flush_pending_interactions(self) -> int:
+        """
+        Write all buffered interactions in a single transaction, then
+        extract facts from them
+        
+        Returns:
+            int: Number of rows written
+        """
+        with self._lock:
+            items = []
+            while True:
+                try:
+                    items.append(self._pending_interactions.get_nowait())
+                except queue.Empty:
+                    break
+            if not items:
+                return 0
+            
+            try:
+                rows = []
+                for session_id, user_input, ai_response, intent, profile_id, character_id in items:
+                    rows.append((
+                        session_id, user_input, ai_response,
+                        interaction_hash(user_input, ai_response), profile_id, character_id
+                    ))
+                
+                self._conn.execute("BEGIN")
+                self._conn.executemany(self._SQL_INSERT_HISTORY, rows)
+                self._conn.execute("COMMIT")
+            except Exception as e:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                self.logger.error(f"❌ Error writing {len(items)} buffered interactions: {e}")
+                return 0
+            
+            # Extract and learn facts from conversation; done under the lock so
+            # readers that flush first also see the facts
+            for session_id, user_input, ai_response, intent, _, _ in items:
+                self._extract_facts_from_interaction(user_input, ai_response, intent, session_id)
+        return len(rows)
+    
+    def _flush_pending_touches(self):
+        """Bump last_used for learned facts that were read from the cache"""
+        fact_keys = set()
+        while True:
+            try:
+                fact_keys.add(self._pending_touches.get_nowait())
+            except queue.Empty:
+                break
+        if not fact_keys:
+            return
+        
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(self._SQL_TOUCH_LEARNED_FACT, [(key,) for key in fact_keys])
+                self._conn.execute("COMMIT")
+            except Exception as e:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                self.logger.error(f"❌ Error updating last_used for {len(fact_keys)} learned facts: {e}")
+    
     def store_interaction(self, session_id: str, user_input: str, ai_response: str, 
                          intent: Dict[str, Any] = None, profile_id: str = None, 
                          character_id: str = None) -> bool:
@@ -118,36 +417,53 @@ class ContextManager:
             character_id (str): Current character ID
             
         Returns:
-            bool: Success status
+            bool: True once the interaction is queued for writing
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            # Create context hash
-            context_hash = hashlib.md5(f"{user_input}{ai_response}".encode()).hexdigest()
-            
-            cursor.execute('''
-                INSERT INTO conversation_history 
-                (session_id, user_input, ai_response, context_hash, profile_id, character_id)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (session_id, user_input, ai_response, context_hash, profile_id, character_id))
-            
-            conn.commit()
-            conn.close()
-            
-            self.logger.info(f"✅ Stored interaction for session {session_id}")
-            
-            # Extract and learn facts from conversation
-            self._extract_facts_from_interaction(user_input, ai_response, intent)
-            
+            # Hashing, the write and fact extraction happen on the writer thread, which
+            # logs failed batches; read methods flush pending rows first
+            item = (session_id, user_input, ai_response, intent, profile_id, character_id)
+            try:
+                self._pending_interactions.put_nowait(item)
+            except queue.Full:
+                # If the queue is full the calling thread drains it
+                self._flush_pending_interactions()
+                self._pending_interactions.put_nowait(item)
+            if self._closed:
+                self._flush_pending_interactions()
+            elif self._pending_interactions.qsize() >= INTERACTION_BATCH_SIZE:
+                self._flush_event.set()
+            
+            self.logger.debug(f"Queued interaction for session {session_id}")
             return True
             
         except Exception as e:
             self.logger.error(f"❌ Error storing interaction: {e}")
             return False
     
-    def _extract_facts_from_interaction(self, user_input: str, ai_response: str, intent: Dict[str, Any]):
+    def _handle_name_fact(self, user_id: str, user_input: str, hits: set):
+        """Learn the user's name from an introduction"""
+        # Simple name extraction (in real implementation, use NLP)
+        words = user_input.split()
+        if len(words) > 1:
+            self.learn_user_fact(user_id, "name", words[-1], confidence=0.8, source="conversation")
+    
+    def _handle_like_fact(self, user_id: str, user_input: str, hits: set):
+        """Record interests from a statement of liking something"""
+        # Extract preferences (simplified)
+        if "music" in hits:
+            self.set_user_preference(user_id, "interest_music", "true")
+        elif "sports" in hits:
+            self.set_user_preference(user_id, "interest_sports", "true")
+    
+    # Keyword tag -> handler; built once when the class is loaded
+    _FACT_HANDLERS = (
+        ("name", _handle_name_fact),
+        ("like", _handle_like_fact),
+    )
+    
+    def _extract_facts_from_interaction(self, user_input: str, ai_response: str, intent: Dict[str, Any],
+                                        user_id: str = None):
         """
         Extract potential facts from conversation for learning
         
@@ -155,25 +471,16 @@ class ContextManager:
             user_input (str): User's input
             ai_response (str): AI's response
             intent (Dict): Intent analysis data
+            user_id (str): User the facts belong to (the engine uses its session id)
         """
         try:
-            user_input_lower = user_input.lower()
-            
-            # Name extraction
-            if "adım" in user_input_lower or "benim adım" in user_input_lower or "my name is" in user_input_lower:
-                # Simple name extraction (in real implementation, use NLP)
-                words = user_input.split()
-                if len(words) > 1:
-                    potential_name = words[-1] if "adım" in user_input_lower else words[-1]
-                    self.learn_user_fact("name", potential_name, confidence=0.8, source="conversation")
-            
-            # Preference extraction
-            if "beğen" in user_input_lower or "like" in user_input_lower:
-                # Extract preferences (simplified)
-                if "müzik" in user_input_lower or "music" in user_input_lower:
-                    self.set_user_preference("interest_music", "true")
-                elif "spor" in user_input_lower or "sports" in user_input_lower:
-                    self.set_user_preference("interest_sports", "true")
+            hits = _scan_fact_keywords(user_input)
+            if not hits:
+                return
+            
+            for tag, handler in self._FACT_HANDLERS:
+                if tag in hits:
+                    handler(self, user_id, user_input, hits)
                     
         except Exception as e:
             self.logger.debug(f"Fact extraction skipped: {e}")
@@ -191,29 +498,11 @@ class ContextManager:
             List[Dict]: List of context items
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT user_input, ai_response, timestamp, profile_id, character_id
-                FROM conversation_history 
-                WHERE session_id = ?
-                ORDER BY timestamp DESC 
-                LIMIT ?
-            ''', (session_id, max_history))
-            
-            rows = cursor.fetchall()
-            conn.close()
-            
-            context_items = []
-            for row in rows:
-                context_items.append({
-                    'user_input': row[0],
-                    'ai_response': row[1],
-                    'timestamp': row[2],
-                    'profile_id': row[3],
-                    'character_id': row[4]
-                })
+            with self._lock:
+                self._flush_pending_interactions()
+                context_items = [
+                    dict(row) for row in self._conn.execute(self._SQL_SELECT_CONTEXT, (session_id, max_history))
+                ]
             
             self.logger.debug(f"Retrieved {len(context_items)} context items for session {session_id}")
             return context_items
@@ -234,34 +523,14 @@ class ContextManager:
             List[Dict]: Recent context items
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            since_time = datetime.now() - timedelta(hours=hours)
-            
-            cursor.execute('''
-                SELECT session_id, user_input, ai_response, timestamp, profile_id, character_id
-                FROM conversation_history 
-                WHERE timestamp > ?
-                ORDER BY timestamp DESC 
-                LIMIT ?
-            ''', (since_time, limit))
-            
-            rows = cursor.fetchall()
-            conn.close()
-            
-            context_items = []
-            for row in rows:
-                context_items.append({
-                    'session_id': row[0],
-                    'user_input': row[1],
-                    'ai_response': row[2],
-                    'timestamp': row[3],
-                    'profile_id': row[4],
-                    'character_id': row[5]
-                })
+            # timestamp is written by CURRENT_TIMESTAMP (UTC, "YYYY-MM-DD HH:MM:SS")
+            since_time = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(time.time() - hours * 3600))
             
-            return context_items
+            with self._lock:
+                self._flush_pending_interactions()
+                return [
+                    dict(row) for row in self._conn.execute(self._SQL_SELECT_RECENT_CONTEXT, (since_time, limit))
+                ]
             
         except Exception as e:
             self.logger.error(f"Error retrieving recent context: {e}")
@@ -280,17 +549,9 @@ class ContextManager:
             bool: Success status
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO user_preferences 
-                (user_id, preference_key, preference_value, last_updated)
-                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (user_id, key, value))
-            
-            conn.commit()
-            conn.close()
+            with self._lock:
+                self._conn.execute(self._SQL_UPSERT_PREFERENCE, (user_id, key, value))
+                self._cache_put(("pref", user_id, key), value)
             
             self.logger.info(f"Set preference for user {user_id}: {key} = {value}")
             return True
@@ -310,23 +571,20 @@ class ContextManager:
         Returns:
             str or None: Preference value or None if not found
         """
+        # Facts extracted from pending interactions may update the preference
+        self._flush_pending_interactions()
+        cache_key = ("pref", user_id, key)
+        cached = self._read_cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT preference_value FROM user_preferences
-                WHERE user_id = ? AND preference_key = ?
-                ORDER BY last_updated DESC
-                LIMIT 1
-            ''', (user_id, key))
+            with self._lock:
+                row = self._conn.execute(self._SQL_SELECT_PREFERENCE, (user_id, key)).fetchone()
             
-            row = cursor.fetchone()
-            conn.close()
-            
-            if row:
-                return row[0]
-            return None
+            value = row[0] if row else None
+            self._cache_put(cache_key, value)
+            return value
             
         except Exception as e:
             self.logger.error(f"Error getting preference: {e}")
@@ -343,17 +601,8 @@ class ContextManager:
             Dict: Dictionary of all preferences
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT preference_key, preference_value FROM user_preferences
-                WHERE user_id = ?
-                ORDER BY last_updated DESC
-            ''', (user_id,))
-            
-            rows = cursor.fetchall()
-            conn.close()
+            with self._lock:
+                rows = self._conn.execute(self._SQL_SELECT_ALL_PREFERENCES, (user_id,)).fetchall()
             
             preferences = {}
             for key, value in rows:
@@ -381,17 +630,9 @@ class ContextManager:
             bool: Success status
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO user_facts 
-                (user_id, fact_key, fact_value, confidence, created_at, last_confirmed)
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-            ''', (user_id, fact_key, fact_value, confidence))
-            
-            conn.commit()
-            conn.close()
+            with self._lock:
+                self._conn.execute(self._SQL_UPSERT_USER_FACT, (user_id, fact_key, fact_value, confidence))
+                self._cache_put(("user_fact", user_id, fact_key), fact_value)
             
             self.logger.info(f"Learned fact for user {user_id}: {fact_key} = {fact_value}")
             return True
@@ -411,23 +652,20 @@ class ContextManager:
         Returns:
             str or None: Fact value or None if not found
         """
+        # Facts extracted from pending interactions may update the fact
+        self._flush_pending_interactions()
+        cache_key = ("user_fact", user_id, fact_key)
+        cached = self._read_cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT fact_value, confidence FROM user_facts
-                WHERE user_id = ? AND fact_key = ?
-                ORDER BY last_confirmed DESC
-                LIMIT 1
-            ''', (user_id, fact_key))
+            with self._lock:
+                row = self._conn.execute(self._SQL_SELECT_USER_FACT, (user_id, fact_key)).fetchone()
             
-            row = cursor.fetchone()
-            conn.close()
-            
-            if row:
-                return row[0]  # Return just the fact value
-            return None
+            value = row[0] if row else None  # Return just the fact value
+            self._cache_put(cache_key, value)
+            return value
             
         except Exception as e:
             self.logger.error(f"Error getting user fact: {e}")
@@ -448,17 +686,9 @@ class ContextManager:
             bool: Success status
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO learned_facts 
-                (fact_key, fact_value, confidence, source, created_at, last_used)
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-            ''', (fact_key, fact_value, confidence, source))
-            
-            conn.commit()
-            conn.close()
+            with self._lock:
+                self._conn.execute(self._SQL_UPSERT_LEARNED_FACT, (fact_key, fact_value, confidence, source))
+                self._cache_put(("learned", fact_key), fact_value)
             
             self.logger.info(f"Learned general fact: {fact_key} = {fact_value}")
             return True
@@ -477,33 +707,33 @@ class ContextManager:
         Returns:
             str or None: Fact value or None if not found
         """
+        cache_key = ("learned", fact_key)
+        cached = self._read_cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            if cached is not None:
+                self._pending_touches.put(fact_key)
+            return cached
+        
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT fact_value, confidence FROM learned_facts
-                WHERE fact_key = ?
-                ORDER BY last_used DESC
-                LIMIT 1
-            ''', (fact_key,))
-            
-            row = cursor.fetchone()
-            conn.close()
-            
-            if row:
-                # Update last_used timestamp
-                conn = sqlite3.connect(str(self.db_path))
-                cursor = conn.cursor()
-                cursor.execute('''
-                    UPDATE learned_facts SET last_used = CURRENT_TIMESTAMP
-                    WHERE fact_key = ?
-                ''', (fact_key,))
-                conn.commit()
-                conn.close()
-                
-                return row[0]
-            return None
+            with self._lock:
+                if SQLITE_HAS_RETURNING:
+                    # Read and bump last_used in one statement
+                    rows = self._conn.execute(self._SQL_FETCH_AND_TOUCH_LEARNED_FACT, (fact_key,)).fetchall()
+                else:
+                    self._conn.execute("BEGIN")
+                    try:
+                        rows = self._conn.execute(self._SQL_SELECT_LEARNED_FACT, (fact_key,)).fetchall()
+                        if rows:
+                            # Update last_used timestamp
+                            self._conn.execute(self._SQL_TOUCH_LEARNED_FACT, (fact_key,))
+                        self._conn.execute("COMMIT")
+                    except Exception:
+                        self._conn.execute("ROLLBACK")
+                        raise
+            
+            value = rows[0][0] if rows else None
+            self._cache_put(cache_key, value)
+            return value
             
         except Exception as e:
             self.logger.error(f"Error getting learned fact: {e}")
@@ -520,15 +750,9 @@ class ContextManager:
             bool: Success status
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                DELETE FROM conversation_history WHERE session_id = ?
-            ''', (session_id,))
-            
-            conn.commit()
-            conn.close()
+            with self._lock:
+                self._flush_pending_interactions()
+                self._conn.execute(self._SQL_DELETE_SESSION, (session_id,))
             
             self.logger.info(f"Cleared context for session {session_id}")
             return True
@@ -544,35 +768,28 @@ class ContextManager:
         Returns:
             Dict: Statistics about stored context
         """
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cached_at < CONTEXT_STATS_TTL:
+            return dict(self._stats_cache)
+        
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            # Total conversations
-            cursor.execute('SELECT COUNT(*) FROM conversation_history')
-            total_conversations = cursor.fetchone()[0]
-            
-            # Total users
-            cursor.execute('SELECT COUNT(DISTINCT session_id) FROM conversation_history')
-            total_sessions = cursor.fetchone()[0]
-            
-            # Total preferences
-            cursor.execute('SELECT COUNT(*) FROM user_preferences')
-            total_preferences = cursor.fetchone()[0]
-            
-            # Total learned facts
-            cursor.execute('SELECT COUNT(*) FROM learned_facts')
-            total_facts = cursor.fetchone()[0]
-            
-            conn.close()
+            with self._lock:
+                self._flush_pending_interactions()
+                # All counts in one query
+                total_conversations, total_sessions, total_preferences, total_facts = (
+                    self._conn.execute(self._SQL_CONTEXT_STATS).fetchone()
+                )
             
-            return {
+            stats = {
                 "total_conversations": total_conversations,
                 "total_sessions": total_sessions,
                 "total_preferences": total_preferences,
                 "total_learned_facts": total_facts,
                 "database_path": str(self.db_path)
             }
+            self._stats_cache = stats
+            self._stats_cached_at = now
+            return dict(stats)
             
         except Exception as e:
             self.logger.error(f"Error getting context stats: {e}")
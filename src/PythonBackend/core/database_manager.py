@@ -4,29 +4,313 @@ Enhanced database operations and optimization
 """
 
 import sqlite3
+import asyncio
+import atexit
 import json
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from datetime import datetime
 from pathlib import Path
 import threading
+import queue
+from collections import deque
+from contextlib import contextmanager
+
+try:
+    from .hashing import interaction_hash
+except ImportError:
+    from hashing import interaction_hash
+
+# Faster JSON parsing/serialization for intent_data when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_dumps(data: Any) -> str:
+    """Serialize data to a JSON string for a TEXT column"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data)
+
+def _json_loads(data: str) -> Any:
+    """Parse a JSON string read from a TEXT column"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Row factories specialized for the column order of their queries, so each row
+# becomes its final dict in one step instead of via sqlite3.Row lookups
+
+def _history_row(cursor: sqlite3.Cursor, row: tuple) -> Dict[str, Any]:
+    """Build a conversation history item from a _SQL_SELECT_HISTORY row"""
+    return {
+        'session_id': row[0],
+        'user_input': row[1],
+        'ai_response': row[2],
+        'timestamp': row[3],
+        'profile_id': row[4],
+        'character_id': row[5],
+        'intent_data': _json_loads(row[6]) if row[6] else None,
+        'response_confidence': row[7],
+        'processing_time_ms': row[8]
+    }
+
+def _fact_row(cursor: sqlite3.Cursor, row: tuple) -> Dict[str, Any]:
+    """Build a learned fact dict from a _SQL_SELECT_FACT / _SQL_FETCH_AND_TOUCH_FACT row"""
+    return {
+        'key': row[0],
+        'value': row[1],
+        'category': row[2],
+        # RETURNING can hand back integral REALs as int (e.g. 1 instead of 1.0)
+        'confidence': float(row[3]) if row[3] is not None else None,
+        'source': row[4],
+        'learning_method': row[5],
+        'created_at': row[6],
+        'last_used': row[7],
+        'usage_count': row[8]
+    }
+
+def _metric_summary_row(cursor: sqlite3.Cursor, row: tuple) -> Tuple[str, Dict[str, Any]]:
+    """Build a (metric_name, summary) pair from a metrics summary row"""
+    return row[0], {
+        'average': row[1],
+        'minimum': row[2],
+        'maximum': row[3],
+        'count': row[4]
+    }
+
+# Size of the sqlite3 module's own prepared-statement cache (default 128)
+CACHED_STATEMENTS = 256
+
+# Pool size used when system_config has no usable max_db_connections
+DEFAULT_MAX_CONNECTIONS = 10
+
+# store_metric buffering: flush after this many rows or seconds, whichever comes first.
+# Buffered metrics that have not been flushed are lost if the process crashes.
+METRIC_FLUSH_SIZE = 256
+METRIC_FLUSH_INTERVAL = 5.0
+
+# cleanup_old_data deletes in chunks of this many rows, one short transaction each
+CLEANUP_BATCH_SIZE = 5000
+
+# Rows per index that ANALYZE samples, so refreshing statistics stays cheap on large tables
+ANALYSIS_LIMIT = 1000
+
+# UPDATE ... RETURNING requires SQLite 3.35+
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+@contextmanager
+def _immediate_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Run a block inside BEGIN IMMEDIATE ... COMMIT on an autocommit connection
+    
+    The write lock is taken up front, so concurrent writers wait on
+    busy_timeout instead of failing with SQLITE_BUSY on a lock upgrade.
+    
+    Args:
+        conn (sqlite3.Connection): Connection opened with isolation_level=None
+        
+    Yields:
+        sqlite3.Connection: The same connection; rolled back if the block raises
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+class _StatementCachingConnection(sqlite3.Connection):
+    """Connection that reuses one cursor per SQL text for hot statements"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statements: Dict[str, sqlite3.Cursor] = {}
+    
+    def execute_cached(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """
+        Execute a statement on the cursor cached for its SQL text
+        
+        Args:
+            sql (str): SQL statement
+            params (tuple): Bound parameters
+            
+        Returns:
+            sqlite3.Cursor: Cursor holding the results
+        """
+        cursor = self.statements.get(sql)
+        if cursor is None:
+            cursor = self.cursor()
+            self.statements[sql] = cursor
+        cursor.execute(sql, params)
+        return cursor
+    
+    def close(self):
+        for cursor in self.statements.values():
+            cursor.close()
+        self.statements.clear()
+        super().close()
+
 
 class DatabaseManager:
     """Enhanced database management with optimization and advanced features"""
     
-    def __init__(self, db_path: str = "../databases/ai_assistant.db"):
+    # SQL text lives on the class so every call reuses the same string objects,
+    # which are also the keys of the per-connection statement cache
+    _SQL_INSERT_CONVERSATION = '''
+        INSERT INTO conversation_history
+        (session_id, user_input, ai_response, context_hash, profile_id, character_id,
+         intent_data, response_confidence, processing_time_ms)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    _SQL_INSERT_METRIC = '''
+        INSERT INTO system_metrics
+        (metric_name, metric_value, category, session_id)
+        VALUES (?, ?, ?, ?)
+    '''
+    _SQL_SELECT_HISTORY = '''
+        SELECT session_id, user_input, ai_response, timestamp,
+               profile_id, character_id, intent_data, response_confidence,
+               processing_time_ms
+        FROM conversation_history
+        WHERE session_id = ? AND timestamp > datetime('now', ?)
+        ORDER BY timestamp DESC
+        LIMIT ?
+    '''
+    _SQL_METRICS_SUMMARY_BY_CATEGORY = '''
+        SELECT metric_name, AVG(metric_value) as avg_value,
+               MIN(metric_value) as min_value, MAX(metric_value) as max_value,
+               COUNT(*) as count
+        FROM system_metrics
+        WHERE category = ? AND timestamp > datetime('now', ?)
+        GROUP BY metric_name
+    '''
+    _SQL_METRICS_SUMMARY = '''
+        SELECT metric_name, AVG(metric_value) as avg_value,
+               MIN(metric_value) as min_value, MAX(metric_value) as max_value,
+               COUNT(*) as count
+        FROM system_metrics
+        WHERE timestamp > datetime('now', ?)
+        GROUP BY metric_name
+    '''
+    _SQL_UPSERT_PREFERENCE = '''
+        INSERT OR REPLACE INTO user_preferences
+        (user_id, category, preference_key, preference_value, data_type, last_updated)
+        VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    '''
+    _SQL_SELECT_PREFERENCE = '''
+        SELECT preference_value FROM user_preferences
+        WHERE user_id = ? AND category = ? AND preference_key = ?
+        ORDER BY last_updated DESC
+        LIMIT 1
+    '''
+    _SQL_SELECT_PREFERENCES_BY_CATEGORY = '''
+        SELECT preference_key, preference_value FROM user_preferences
+        WHERE user_id = ? AND category = ?
+        ORDER BY last_updated DESC
+    '''
+    _SQL_UPSERT_LEARNED_FACT = '''
+        INSERT INTO learned_facts
+        (fact_key, fact_value, category, confidence, source, learning_method,
+         created_at, last_used, usage_count)
+        VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 1)
+        ON CONFLICT(fact_key) DO UPDATE SET
+            fact_value = excluded.fact_value,
+            confidence = excluded.confidence,
+            source = excluded.source,
+            learning_method = excluded.learning_method,
+            last_used = CURRENT_TIMESTAMP,
+            usage_count = learned_facts.usage_count + 1
+    '''
+    _SQL_FETCH_AND_TOUCH_FACT = '''
+        UPDATE learned_facts SET last_used = CURRENT_TIMESTAMP
+        WHERE fact_key = ?
+        RETURNING fact_key, fact_value, category, confidence, source,
+                  learning_method, created_at, last_used, usage_count
+    '''
+    _SQL_SELECT_FACT = '''
+        SELECT fact_key, fact_value, category, confidence, source,
+               learning_method, created_at, last_used, usage_count
+        FROM learned_facts
+        WHERE fact_key = ?
+        ORDER BY last_used DESC
+        LIMIT 1
+    '''
+    _SQL_TOUCH_FACT = '''
+        UPDATE learned_facts SET last_used = CURRENT_TIMESTAMP
+        WHERE fact_key = ?
+    '''
+    _SQL_SELECT_ALL_CONFIG = '''
+        SELECT config_key, config_value FROM system_config
+    '''
+    _SQL_UPSERT_CONFIG = '''
+        INSERT OR REPLACE INTO system_config
+        (config_key, config_value, config_type, description, last_modified)
+        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+    '''
+    _SQL_DATA_VERSION = "PRAGMA data_version"
+    _SQL_DATABASE_STATS = '''
+        SELECT conv.total, conv.sessions, conv.avg_confidence,
+               (SELECT COUNT(*) FROM user_preferences),
+               (SELECT COUNT(*) FROM learned_facts),
+               (SELECT COUNT(*) FROM user_facts)
+        FROM (
+            SELECT COUNT(*) AS total, COUNT(DISTINCT session_id) AS sessions,
+                   AVG(response_confidence) AS avg_confidence
+            FROM conversation_history
+        ) AS conv
+    '''
+    _SQL_TABLE_STATS = '''
+        SELECT tbl, idx, stat FROM sqlite_stat1
+    '''
+    
+    # Tables whose row counts the planner and get_database_stats(exact=False) rely on
+    _STATS_TABLES = ("conversation_history", "system_metrics", "user_preferences",
+                     "learned_facts", "user_facts")
+    
+    def __init__(self, db_path: str = "../databases/ai_assistant.db", synchronous: str = "NORMAL"):
         """
         Initialize Database Manager
         
         Args:
             db_path (str): Path to main database file
+            synchronous (str): SQLite synchronous level (FULL, NORMAL or OFF);
+                OFF trades crash durability for faster best-effort writes
         """
         self.logger = self._setup_logger()
         self.db_path = Path(db_path)
+        self.synchronous = synchronous.upper()
+        if self.synchronous not in ("FULL", "NORMAL", "OFF"):
+            raise ValueError(f"Invalid synchronous level: {synchronous}")
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.connection_pool = {}
         self.lock = threading.Lock()
         self._initialize_databases()
+        
+        # WAL: one writer connection plus a pool of read-only readers
+        self.max_connections = self._load_max_connections()
+        self._writer_lock = threading.RLock()
+        self._writer: Optional[sqlite3.Connection] = self._create_writer_connection()
+        self._reader_count = max(1, self.max_connections - 1)
+        self._readers: queue.LifoQueue = queue.LifoQueue(maxsize=self._reader_count)
+        for _ in range(self._reader_count):
+            self._readers.put(self._create_reader_connection())
+        self._readers_created = self._reader_count
+        
+        # Metrics are buffered in memory and written in batches
+        self._metric_buffer: deque = deque()
+        self._metric_lock = threading.Lock()
+        self._metric_timer: Optional[threading.Timer] = None
+        atexit.register(self._flush_metrics)
+        
+        # system_config is cached; PRAGMA data_version changes if another process writes
+        self._config_generation = 0
+        self._config_version: Optional[int] = self._poll_data_version()
+        self._config_cache: Optional[Dict[str, str]] = self._load_config_cache()
         self.logger.info("DatabaseManager initialized")
     
     def _setup_logger(self) -> logging.Logger:
@@ -40,16 +324,48 @@ class DatabaseManager:
         logger.setLevel(logging.INFO)
         return logger
     
+    def _connect(self, check_same_thread: bool = True, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a connection to the main database with tuned PRAGMAs
+        
+        Args:
+            check_same_thread (bool): Restrict the connection to the creating thread
+            read_only (bool): Open with mode=ro and PRAGMA query_only
+            
+        Returns:
+            sqlite3.Connection: Configured connection
+        """
+        if read_only:
+            database, uri = f"{self.db_path.resolve().as_uri()}?mode=ro", True
+        else:
+            database, uri = str(self.db_path), False
+        conn = sqlite3.connect(database, uri=uri, factory=_StatementCachingConnection,
+                               cached_statements=CACHED_STATEMENTS,
+                               check_same_thread=check_same_thread,
+                               isolation_level=None)  # autocommit; transactions are explicit
+        # WAL: readers don't wait for the writer, no fsync per commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        conn.execute("PRAGMA cache_size=-65536")  # ~64 MB
+        conn.execute("PRAGMA busy_timeout=5000")
+        if read_only:
+            conn.execute("PRAGMA query_only=1")
+        return conn
+    
     def _initialize_databases(self):
         """Initialize all required database tables with enhanced schema"""
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
             
             # Enhanced conversation history with indexing
+            # (plain rowid alias: monotonic without the sqlite_sequence bookkeeping)
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS conversation_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     session_id TEXT,
                     timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
                     user_input TEXT,
@@ -94,10 +410,10 @@ class DatabaseManager:
             ''')
             
             # Enhanced learned facts with categories and sources
+            # Key-value table: fact_key is the primary key, no separate rowid tree
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS learned_facts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    fact_key TEXT UNIQUE,
+                    fact_key TEXT PRIMARY KEY,
                     fact_value TEXT,
                     category TEXT,
                     confidence REAL,
@@ -106,7 +422,7 @@ class DatabaseManager:
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                     last_used DATETIME DEFAULT CURRENT_TIMESTAMP,
                     usage_count INTEGER DEFAULT 1
-                )
+                ) WITHOUT ROWID
             ''')
             
             cursor.execute('''
@@ -148,19 +464,32 @@ class DatabaseManager:
                 )
             ''')
             
+            # Covering indexes for get_metrics_summary (with and without category)
+            # and the timestamp range delete in cleanup_old_data
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_metrics_cat_ts 
+                ON system_metrics(category, timestamp, metric_name, metric_value)
+            ''')
+            
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_metrics_ts 
+                ON system_metrics(timestamp, metric_name, metric_value)
+            ''')
+            
             # Configuration settings table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS system_config (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    config_key TEXT UNIQUE,
+                    config_key TEXT PRIMARY KEY,
                     config_value TEXT,
                     config_type TEXT,
                     description TEXT,
                     last_modified DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
+                ) WITHOUT ROWID
             ''')
             
             conn.commit()
+            
+            self._refresh_planner_stats(conn)
             conn.close()
             self.logger.info("✅ Enhanced databases initialized successfully")
             
@@ -184,64 +513,175 @@ class DatabaseManager:
         ]
         
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            for config_key, config_value, config_type, description in default_configs:
-                cursor.execute('''
+            conn = self._connect()
+            with _immediate_transaction(conn):
+                conn.executemany('''
                     INSERT OR IGNORE INTO system_config 
                     (config_key, config_value, config_type, description)
                     VALUES (?, ?, ?, ?)
-                ''', (config_key, config_value, config_type, description))
-            
-            conn.commit()
+                ''', default_configs)
             conn.close()
             self.logger.info("✅ Default configurations initialized")
             
         except Exception as e:
             self.logger.error(f"❌ Default config initialization error: {e}")
     
-    def get_connection(self, connection_id: str = "default") -> sqlite3.Connection:
+    def _refresh_planner_stats(self, conn: sqlite3.Connection, force: bool = False):
         """
-        Get database connection with pooling
+        Keep sqlite_stat1 filled in for the query planner
+        
+        ANALYZE writes no rows for empty tables, and PRAGMA optimize does not
+        analyze a table that has no statistics yet, so a table that gained rows
+        since the last ANALYZE needs an explicit one.
         
         Args:
-            connection_id (str): Connection identifier
-            
+            conn (sqlite3.Connection): Writable connection
+            force (bool): Re-analyze even if every non-empty table has statistics
+        """
+        analyzed = set()
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone():
+            analyzed = {row[0] for row in conn.execute("SELECT DISTINCT tbl FROM sqlite_stat1")}
+        missing = [
+            table for table in self._STATS_TABLES
+            if table not in analyzed and conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone()
+        ]
+        
+        conn.execute(f"PRAGMA analysis_limit={ANALYSIS_LIMIT}")
+        if force or missing:
+            conn.execute("ANALYZE")
+        else:
+            conn.execute("PRAGMA optimize")
+    
+    def _load_max_connections(self) -> int:
+        """
+        Read the pool size from the max_db_connections config entry
+        
         Returns:
-            sqlite3.Connection: Database connection
+            int: Number of pooled connections (at least 1)
         """
-        with self.lock:
-            if connection_id not in self.connection_pool:
-                conn = sqlite3.connect(str(self.db_path))
-                conn.row_factory = sqlite3.Row  # Enable column access by name
-                self.connection_pool[connection_id] = conn
-                self.logger.debug(f"Created new database connection: {connection_id}")
-            return self.connection_pool[connection_id]
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT config_value FROM system_config WHERE config_key = 'max_db_connections'"
+            ).fetchone()
+            conn.close()
+            return max(1, int(row[0])) if row else DEFAULT_MAX_CONNECTIONS
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.warning(f"Using default pool size: {e}")
+            return DEFAULT_MAX_CONNECTIONS
     
-    def close_connection(self, connection_id: str = "default"):
+    def _create_writer_connection(self) -> sqlite3.Connection:
         """
-        Close specific database connection
+        Create the single connection that all writes go through
         
-        Args:
-            connection_id (str): Connection identifier
+        Returns:
+            sqlite3.Connection: Read-write connection usable from any thread
         """
-        with self.lock:
-            if connection_id in self.connection_pool:
-                self.connection_pool[connection_id].close()
-                del self.connection_pool[connection_id]
-                self.logger.debug(f"Closed database connection: {connection_id}")
+        conn = self._connect(check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        self.logger.debug("Created writer database connection")
+        return conn
+    
+    def _create_reader_connection(self) -> sqlite3.Connection:
+        """
+        Create a read-only connection for the reader pool
+        
+        Returns:
+            sqlite3.Connection: Read-only connection usable from any thread
+        """
+        # Pooled connections are handed between threads
+        conn = self._connect(check_same_thread=False, read_only=True)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        self.logger.debug("Created reader database connection")
+        return conn
+    
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Hold the writer connection for the duration of a block
+        
+        Writes are serialized through one connection; under WAL they do not
+        block the readers.
+        
+        Yields:
+            sqlite3.Connection: Read-write database connection
+        """
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = self._create_writer_connection()
+            conn = self._writer
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+    
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a read-only connection from the pool for the duration of a block
+        
+        Yields:
+            sqlite3.Connection: Read-only connection, returned to the pool on exit
+        """
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self.lock:
+                can_create = self._readers_created < self._reader_count
+                if can_create:
+                    self._readers_created += 1
+            # After the pool is closed, connections are reopened lazily
+            conn = self._create_reader_connection() if can_create else self._readers.get()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._readers.put(conn)
     
     def close_all_connections(self):
-        """Close all database connections"""
-        with self.lock:
-            for conn_id, conn in self.connection_pool.items():
+        """Flush buffered metrics and close the writer and all idle reader connections"""
+        self._flush_metrics()
+        while True:
+            try:
+                conn = self._readers.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.close()
+            except Exception as e:
+                self.logger.error(f"Error closing reader connection: {e}")
+            with self.lock:
+                self._readers_created -= 1
+        
+        with self._writer_lock:
+            if self._writer is not None:
                 try:
-                    conn.close()
-                    self.logger.debug(f"Closed connection: {conn_id}")
+                    # Read-only connections can't ANALYZE; statistics are refreshed on the writer
+                    self._refresh_planner_stats(self._writer)
+                    self._writer.close()
                 except Exception as e:
-                    self.logger.error(f"Error closing connection {conn_id}: {e}")
-            self.connection_pool.clear()
+                    self.logger.error(f"Error closing writer connection: {e}")
+                self._writer = None
+        self.logger.debug("Closed database connections")
+    
+    @contextmanager
+    def batch(self) -> Iterator[sqlite3.Connection]:
+        """
+        Group several writes into a single transaction
+        
+        Yields:
+            sqlite3.Connection: Connection to write through; committed on
+            normal exit and rolled back if the block raises
+        """
+        with self.writer() as conn:
+            try:
+                with _immediate_transaction(conn):
+                    yield conn
+            finally:
+                # The batch may have touched system_config
+                self._invalidate_config_cache()
     
     def store_conversation_with_metrics(self, session_id: str, user_input: str, 
                                       ai_response: str, intent_data: Dict[str, Any] = None,
@@ -265,30 +705,24 @@ class DatabaseManager:
             bool: Success status
         """
         try:
-            conn = self.get_connection(f"conv_{session_id}")
-            cursor = conn.cursor()
-            
-            # Create context hash
-            import hashlib
-            context_hash = hashlib.md5(f"{user_input}{ai_response}".encode()).hexdigest()
-            
-            cursor.execute('''
-                INSERT INTO conversation_history 
-                (session_id, user_input, ai_response, context_hash, profile_id, character_id,
-                 intent_data, response_confidence, processing_time_ms)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (session_id, user_input, ai_response, context_hash, profile_id, character_id,
-                  json.dumps(intent_data) if intent_data else None, response_confidence, processing_time_ms))
-            
-            conn.commit()
-            
-            self.logger.info(f"✅ Stored conversation with metrics for session {session_id}")
-            
-            # Store performance metrics
-            self.store_metric("processing_time_ms", processing_time_ms, "performance", session_id)
-            self.store_metric("response_confidence", response_confidence, "quality", session_id)
+            with self.writer() as conn:
+                context_hash = interaction_hash(user_input, ai_response)
+            
+                # Conversation and both metrics in one transaction, one commit
+                with _immediate_transaction(conn):
+                    conn.execute_cached(self._SQL_INSERT_CONVERSATION, (
+                        session_id, user_input, ai_response, context_hash, profile_id, character_id,
+                        _json_dumps(intent_data) if intent_data else None, response_confidence, processing_time_ms
+                    ))
+                
+                    # Store performance metrics
+                    conn.executemany(self._SQL_INSERT_METRIC, (
+                        ("processing_time_ms", processing_time_ms, "performance", session_id),
+                        ("response_confidence", response_confidence, "quality", session_id)
+                    ))
             
-            return True
+                self.logger.info(f"✅ Stored conversation with metrics for session {session_id}")
+                return True
             
         except Exception as e:
             self.logger.error(f"❌ Error storing conversation: {e}")
@@ -308,39 +742,16 @@ class DatabaseManager:
             List[Dict]: Conversation history
         """
         try:
-            conn = self.get_connection(f"read_{session_id}")
-            cursor = conn.cursor()
+            with self.reader() as conn:
+                # Cutoff computed by SQLite in the same format (UTC) as CURRENT_TIMESTAMP
+                since_modifier = f"-{int(hours_back)} hours"
             
-            since_time = datetime.now() - timedelta(hours=hours_back)
+                cursor = conn.execute_cached(self._SQL_SELECT_HISTORY, (session_id, since_modifier, limit))
+                cursor.row_factory = _history_row
+                history = cursor.fetchall()
             
-            cursor.execute('''
-                SELECT session_id, user_input, ai_response, timestamp, 
-                       profile_id, character_id, intent_data, response_confidence,
-                       processing_time_ms
-                FROM conversation_history 
-                WHERE session_id = ? AND timestamp > ?
-                ORDER BY timestamp DESC 
-                LIMIT ?
-            ''', (session_id, since_time, limit))
-            
-            rows = cursor.fetchall()
-            
-            history = []
-            for row in rows:
-                history.append({
-                    'session_id': row['session_id'],
-                    'user_input': row['user_input'],
-                    'ai_response': row['ai_response'],
-                    'timestamp': row['timestamp'],
-                    'profile_id': row['profile_id'],
-                    'character_id': row['character_id'],
-                    'intent_data': json.loads(row['intent_data']) if row['intent_data'] else None,
-                    'response_confidence': row['response_confidence'],
-                    'processing_time_ms': row['processing_time_ms']
-                })
-            
-            self.logger.debug(f"Retrieved {len(history)} conversation items for session {session_id}")
-            return history
+                self.logger.debug(f"Retrieved {len(history)} conversation items for session {session_id}")
+                return history
             
         except Exception as e:
             self.logger.error(f"Error retrieving conversation history: {e}")
@@ -349,7 +760,11 @@ class DatabaseManager:
     def store_metric(self, metric_name: str, metric_value: float, 
                     category: str = "general", session_id: str = None) -> bool:
         """
-        Store system performance metrics
+        Queue a system performance metric for the next batched write
+        
+        The row is buffered in memory and written together with other metrics
+        once METRIC_FLUSH_SIZE rows are pending or METRIC_FLUSH_INTERVAL seconds
+        have passed, so a crash can lose the most recent metrics.
         
         Args:
             metric_name (str): Metric name
@@ -360,22 +775,68 @@ class DatabaseManager:
         Returns:
             bool: Success status
         """
+        with self._metric_lock:
+            self._metric_buffer.append((metric_name, metric_value, category, session_id))
+            pending = len(self._metric_buffer)
+            if pending < METRIC_FLUSH_SIZE and self._metric_timer is None:
+                self._metric_timer = threading.Timer(METRIC_FLUSH_INTERVAL, self._flush_metrics)
+                self._metric_timer.daemon = True
+                self._metric_timer.start()
+        
+        if pending >= METRIC_FLUSH_SIZE:
+            return self._flush_metrics()
+        return True
+    
+    def _flush_metrics(self) -> bool:
+        """
+        Write all buffered metrics in a single transaction
+        
+        Returns:
+            bool: Success status
+        """
+        with self._metric_lock:
+            rows = list(self._metric_buffer)
+            self._metric_buffer.clear()
+            timer, self._metric_timer = self._metric_timer, None
+        if timer is not None:
+            timer.cancel()
+        if not rows:
+            return True
+        
         try:
-            conn = self.get_connection("metrics")
-            cursor = conn.cursor()
+            with self.writer() as conn:
+                with _immediate_transaction(conn):
+                    conn.executemany(self._SQL_INSERT_METRIC, rows)
+            self.logger.debug(f"Flushed {len(rows)} buffered metrics")
+            return True
             
-            cursor.execute('''
-                INSERT INTO system_metrics 
-                (metric_name, metric_value, category, session_id)
-                VALUES (?, ?, ?, ?)
-            ''', (metric_name, metric_value, category, session_id))
+        except Exception as e:
+            self.logger.error(f"Error flushing metrics: {e}")
+            return False
+    
+    def store_metrics_bulk(self, metrics: List[tuple]) -> bool:
+        """
+        Store several metrics in one transaction
+        
+        Args:
+            metrics (List[tuple]): (metric_name, metric_value, category, session_id) rows
             
-            conn.commit()
-            self.logger.debug(f"Stored metric: {metric_name} = {metric_value}")
+        Returns:
+            bool: Success status
+        """
+        if not metrics:
             return True
+        
+        try:
+            with self.writer() as conn:
+                with _immediate_transaction(conn):
+                    conn.executemany(self._SQL_INSERT_METRIC, metrics)
+            
+                self.logger.debug(f"Stored {len(metrics)} metrics")
+                return True
             
         except Exception as e:
-            self.logger.error(f"Error storing metric: {e}")
+            self.logger.error(f"Error storing metrics: {e}")
             return False
     
     def get_metrics_summary(self, category: str = None, hours_back: int = 24) -> Dict[str, Any]:
@@ -389,43 +850,18 @@ class DatabaseManager:
         Returns:
             Dict: Metrics summary
         """
+        self._flush_metrics()
         try:
-            conn = self.get_connection("metrics_read")
-            cursor = conn.cursor()
+            with self.reader() as conn:
+                since_modifier = f"-{int(hours_back)} hours"
             
-            since_time = datetime.now() - timedelta(hours=hours_back)
-            
-            if category:
-                cursor.execute('''
-                    SELECT metric_name, AVG(metric_value) as avg_value, 
-                           MIN(metric_value) as min_value, MAX(metric_value) as max_value,
-                           COUNT(*) as count
-                    FROM system_metrics 
-                    WHERE category = ? AND timestamp > ?
-                    GROUP BY metric_name
-                ''', (category, since_time))
-            else:
-                cursor.execute('''
-                    SELECT metric_name, AVG(metric_value) as avg_value, 
-                           MIN(metric_value) as min_value, MAX(metric_value) as max_value,
-                           COUNT(*) as count
-                    FROM system_metrics 
-                    WHERE timestamp > ?
-                    GROUP BY metric_name
-                ''', (since_time,))
-            
-            rows = cursor.fetchall()
-            
-            summary = {}
-            for row in rows:
-                summary[row['metric_name']] = {
-                    'average': row['avg_value'],
-                    'minimum': row['min_value'],
-                    'maximum': row['max_value'],
-                    'count': row['count']
-                }
+                if category:
+                    cursor = conn.execute_cached(self._SQL_METRICS_SUMMARY_BY_CATEGORY, (category, since_modifier))
+                else:
+                    cursor = conn.execute_cached(self._SQL_METRICS_SUMMARY, (since_modifier,))
+                cursor.row_factory = _metric_summary_row
             
-            return summary
+                return dict(cursor.fetchall())
             
         except Exception as e:
             self.logger.error(f"Error getting metrics summary: {e}")
@@ -447,18 +883,11 @@ class DatabaseManager:
             bool: Success status
         """
         try:
-            conn = self.get_connection(f"prefs_{user_id}")
-            cursor = conn.cursor()
+            with self.writer() as conn:
+                conn.execute_cached(self._SQL_UPSERT_PREFERENCE, (user_id, category, key, value, data_type))
             
-            cursor.execute('''
-                INSERT OR REPLACE INTO user_preferences 
-                (user_id, category, preference_key, preference_value, data_type, last_updated)
-                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (user_id, category, key, value, data_type))
-            
-            conn.commit()
-            self.logger.info(f"Set preference for user {user_id}: {category}.{key} = {value}")
-            return True
+                self.logger.info(f"Set preference for user {user_id}: {category}.{key} = {value}")
+                return True
             
         except Exception as e:
             self.logger.error(f"Error setting preference: {e}")
@@ -477,20 +906,13 @@ class DatabaseManager:
             str or None: Preference value or None if not found
         """
         try:
-            conn = self.get_connection(f"prefs_read_{user_id}")
-            cursor = conn.cursor()
+            with self.reader() as conn:
+                cursor = conn.execute_cached(self._SQL_SELECT_PREFERENCE, (user_id, category, key))
             
-            cursor.execute('''
-                SELECT preference_value FROM user_preferences
-                WHERE user_id = ? AND category = ? AND preference_key = ?
-                ORDER BY last_updated DESC
-                LIMIT 1
-            ''', (user_id, category, key))
-            
-            row = cursor.fetchone()
-            if row:
-                return row['preference_value']
-            return None
+                row = cursor.fetchone()
+                if row:
+                    return row['preference_value']
+                return None
             
         except Exception as e:
             self.logger.error(f"Error getting preference: {e}")
@@ -508,22 +930,16 @@ class DatabaseManager:
             Dict: Preferences dictionary
         """
         try:
-            conn = self.get_connection(f"prefs_cat_{user_id}")
-            cursor = conn.cursor()
+            with self.reader() as conn:
+                rows = conn.execute_cached(
+                    self._SQL_SELECT_PREFERENCES_BY_CATEGORY, (user_id, category)
+                ).fetchall()
             
-            cursor.execute('''
-                SELECT preference_key, preference_value FROM user_preferences
-                WHERE user_id = ? AND category = ?
-                ORDER BY last_updated DESC
-            ''', (user_id, category))
-            
-            rows = cursor.fetchall()
+                preferences = {}
+                for row in rows:
+                    preferences[row['preference_key']] = row['preference_value']
             
-            preferences = {}
-            for row in rows:
-                preferences[row['preference_key']] = row['preference_value']
-            
-            return preferences
+                return preferences
             
         except Exception as e:
             self.logger.error(f"Error getting preferences by category: {e}")
@@ -547,36 +963,12 @@ class DatabaseManager:
             bool: Success status
         """
         try:
-            conn = self.get_connection("facts")
-            cursor = conn.cursor()
+            with self.writer() as conn:
+                # One statement: insert, or update and bump the usage count
+                conn.execute_cached(self._SQL_UPSERT_LEARNED_FACT, (fact_key, fact_value, category, confidence, source, learning_method))
             
-            # Check if fact already exists
-            cursor.execute('''
-                SELECT id, usage_count FROM learned_facts WHERE fact_key = ?
-            ''', (fact_key,))
-            
-            row = cursor.fetchone()
-            if row:
-                # Update existing fact
-                usage_count = row['usage_count'] + 1
-                cursor.execute('''
-                    UPDATE learned_facts 
-                    SET fact_value = ?, confidence = ?, source = ?, learning_method = ?,
-                        last_used = CURRENT_TIMESTAMP, usage_count = ?
-                    WHERE fact_key = ?
-                ''', (fact_value, confidence, source, learning_method, usage_count, fact_key))
-            else:
-                # Insert new fact
-                cursor.execute('''
-                    INSERT INTO learned_facts 
-                    (fact_key, fact_value, category, confidence, source, learning_method,
-                     created_at, last_used, usage_count)
-                    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 1)
-                ''', (fact_key, fact_value, category, confidence, source, learning_method))
-            
-            conn.commit()
-            self.logger.info(f"Learned fact: {fact_key} = {fact_value} (confidence: {confidence})")
-            return True
+                self.logger.info(f"Learned fact: {fact_key} = {fact_value} (confidence: {confidence})")
+                return True
             
         except Exception as e:
             self.logger.error(f"Error learning fact: {e}")
@@ -593,44 +985,68 @@ class DatabaseManager:
             Dict or None: Fact data or None if not found
         """
         try:
-            conn = self.get_connection("facts_read")
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT fact_key, fact_value, category, confidence, source, 
-                       learning_method, created_at, last_used, usage_count
-                FROM learned_facts
-                WHERE fact_key = ?
-                ORDER BY last_used DESC
-                LIMIT 1
-            ''', (fact_key,))
-            
-            row = cursor.fetchone()
-            if row:
-                # Update last_used timestamp
-                cursor.execute('''
-                    UPDATE learned_facts SET last_used = CURRENT_TIMESTAMP
-                    WHERE fact_key = ?
-                ''', (fact_key,))
-                conn.commit()
+            with self.writer() as conn:
+                if SQLITE_HAS_RETURNING:
+                    # Read and bump last_used in one statement
+                    # (RETURNING rows must be fully read before commit)
+                    with _immediate_transaction(conn):
+                        cursor = conn.execute_cached(self._SQL_FETCH_AND_TOUCH_FACT, (fact_key,))
+                        cursor.row_factory = _fact_row
+                        rows = cursor.fetchall()
+                    return rows[0] if rows else None
                 
-                return {
-                    'key': row['fact_key'],
-                    'value': row['fact_value'],
-                    'category': row['category'],
-                    'confidence': row['confidence'],
-                    'source': row['source'],
-                    'learning_method': row['learning_method'],
-                    'created_at': row['created_at'],
-                    'last_used': row['last_used'],
-                    'usage_count': row['usage_count']
-                }
-            return None
+                cursor = conn.execute_cached(self._SQL_SELECT_FACT, (fact_key,))
+                cursor.row_factory = _fact_row
+                fact = cursor.fetchone()
+                if fact:
+                    # Update last_used timestamp
+                    conn.execute_cached(self._SQL_TOUCH_FACT, (fact_key,))
+                return fact
             
         except Exception as e:
             self.logger.error(f"Error getting fact: {e}")
             return None
     
+    def _poll_data_version(self) -> Optional[int]:
+        """
+        Read PRAGMA data_version on the writer connection
+        
+        The value only changes when another connection (e.g. another process)
+        commits, since this process writes through the writer itself.
+        
+        Returns:
+            int or None: Current data version, or None if the writer is busy
+        """
+        if not self._writer_lock.acquire(blocking=False):
+            return None
+        try:
+            if self._writer is None:
+                self._writer = self._create_writer_connection()
+            return self._writer.execute_cached(self._SQL_DATA_VERSION).fetchone()[0]
+        finally:
+            self._writer_lock.release()
+    
+    def _load_config_cache(self) -> Dict[str, str]:
+        """
+        Load all of system_config into the in-memory cache
+        
+        Returns:
+            Dict[str, str]: Configuration key -> value
+        """
+        generation = self._config_generation
+        with self.reader() as conn:
+            cache = {row['config_key']: row['config_value']
+                     for row in conn.execute_cached(self._SQL_SELECT_ALL_CONFIG)}
+        # Don't cache a stale snapshot if a write happened during the read
+        if generation == self._config_generation:
+            self._config_cache = cache
+        return cache
+    
+    def _invalidate_config_cache(self):
+        """Drop the config cache so the next read reloads it"""
+        self._config_generation += 1
+        self._config_cache = None
+    
     def get_config_value(self, config_key: str, default_value: str = None) -> str:
         """
         Get configuration value
@@ -643,16 +1059,18 @@ class DatabaseManager:
             str: Configuration value
         """
         try:
-            conn = self.get_connection("config")
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT config_value FROM system_config WHERE config_key = ?
-            ''', (config_key,))
-            
-            row = cursor.fetchone()
-            if row:
-                return row['config_value']
+            cache = self._config_cache
+            version = self._poll_data_version()
+            if version is not None and version != self._config_version:
+                # Another connection changed the database
+                self._config_version = version
+                cache = None
+            if cache is None:
+                cache = self._load_config_cache()
+            
+            value = cache.get(config_key)
+            if value is not None:
+                return value
             return default_value or ""
             
         except Exception as e:
@@ -674,76 +1092,131 @@ class DatabaseManager:
             bool: Success status
         """
         try:
-            conn = self.get_connection("config_write")
-            cursor = conn.cursor()
+            with self.writer() as conn:
+                conn.execute_cached(self._SQL_UPSERT_CONFIG, (config_key, config_value, config_type, description))
+                self._invalidate_config_cache()
             
-            cursor.execute('''
-                INSERT OR REPLACE INTO system_config 
-                (config_key, config_value, config_type, description, last_modified)
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (config_key, config_value, config_type, description))
+                self.logger.info(f"Set config: {config_key} = {config_value}")
+                return True
             
-            conn.commit()
-            self.logger.info(f"Set config: {config_key} = {config_value}")
+        except Exception as e:
+            self.logger.error(f"Error setting config value: {e}")
+            return False
+    
+    def set_config_values(self, items: List[tuple]) -> bool:
+        """
+        Set several configuration values in one transaction
+        
+        Args:
+            items (List[tuple]): (config_key, config_value, config_type, description) rows
+            
+        Returns:
+            bool: Success status
+        """
+        if not items:
             return True
+        
+        try:
+            with self.writer() as conn:
+                with _immediate_transaction(conn):
+                    conn.executemany(self._SQL_UPSERT_CONFIG, items)
+                self._invalidate_config_cache()
+                self.logger.info(f"Set {len(items)} config values")
+                return True
             
         except Exception as e:
-            self.logger.error(f"Error setting config value: {e}")
+            self.logger.error(f"Error setting config values: {e}")
             return False
     
-    def get_database_stats(self) -> Dict[str, Any]:
+    def get_database_stats(self, exact: bool = True) -> Dict[str, Any]:
         """
         Get comprehensive database statistics
         
+        Args:
+            exact (bool): Count rows with one aggregate query; when False, read the
+                row estimates ANALYZE stored in sqlite_stat1 instead (near free, but
+                only as fresh as the last ANALYZE / PRAGMA optimize)
+        
         Returns:
             Dict: Database statistics
         """
         try:
-            conn = self.get_connection("stats")
-            cursor = conn.cursor()
-            
-            stats = {}
-            
-            # Conversation history count
-            cursor.execute('SELECT COUNT(*) FROM conversation_history')
-            stats['total_conversations'] = cursor.fetchone()[0]
-            
-            # User preferences count
-            cursor.execute('SELECT COUNT(*) FROM user_preferences')
-            stats['total_preferences'] = cursor.fetchone()[0]
-            
-            # Learned facts count
-            cursor.execute('SELECT COUNT(*) FROM learned_facts')
-            stats['total_learned_facts'] = cursor.fetchone()[0]
-            
-            # User facts count
-            cursor.execute('SELECT COUNT(*) FROM user_facts')
-            stats['total_user_facts'] = cursor.fetchone()[0]
-            
-            # Active sessions
-            cursor.execute('SELECT COUNT(DISTINCT session_id) FROM conversation_history')
-            stats['active_sessions'] = cursor.fetchone()[0]
-            
-            # Average response confidence
-            cursor.execute('SELECT AVG(response_confidence) FROM conversation_history')
-            avg_confidence = cursor.fetchone()[0]
-            stats['average_response_confidence'] = round(avg_confidence or 0, 3)
-            
-            # Database file size
-            try:
-                stats['database_size_mb'] = round(self.db_path.stat().st_size / (1024 * 1024), 2)
-            except Exception:
-                stats['database_size_mb'] = 0
+            with self.reader() as conn:
+                stats = {}
+                approximate = None if exact else self._approximate_stats(conn)
+                
+                if approximate is not None:
+                    stats.update(approximate)
+                    stats['average_response_confidence'] = None
+                else:
+                    # All counts in one query; conversation_history is scanned once
+                    (total_conversations, active_sessions, avg_confidence, total_preferences,
+                     total_learned_facts, total_user_facts) = conn.execute_cached(self._SQL_DATABASE_STATS).fetchone()
+                    stats['total_conversations'] = total_conversations
+                    stats['total_preferences'] = total_preferences
+                    stats['total_learned_facts'] = total_learned_facts
+                    stats['total_user_facts'] = total_user_facts
+                    stats['active_sessions'] = active_sessions
+                    stats['average_response_confidence'] = round(avg_confidence or 0, 3)
+                stats['approximate'] = approximate is not None
+            
+                # Database file size
+                try:
+                    stats['database_size_mb'] = round(self.db_path.stat().st_size / (1024 * 1024), 2)
+                except Exception:
+                    stats['database_size_mb'] = 0
             
-            stats['database_path'] = str(self.db_path)
-            stats['connection_pool_size'] = len(self.connection_pool)
+                stats['database_path'] = str(self.db_path)
+                stats['connection_pool_size'] = self.max_connections
             
-            return stats
+                return stats
             
         except Exception as e:
             self.logger.error(f"Error getting database stats: {e}")
             return {}
     
+    def _approximate_stats(self, conn: sqlite3.Connection) -> Optional[Dict[str, int]]:
+        """
+        Estimate row counts from the sqlite_stat1 table
+        
+        Each stat string starts with the table's row count; the second number of
+        idx_session_timestamp is the average number of rows per session.
+        
+        Args:
+            conn (sqlite3.Connection): Connection to read through
+            
+        Returns:
+            Dict or None: Estimated counts, or None if a table has no statistics
+            (not analyzed yet, or empty when it was analyzed)
+        """
+        try:
+            rows = conn.execute_cached(self._SQL_TABLE_STATS).fetchall()
+        except sqlite3.OperationalError:
+            return None  # sqlite_stat1 does not exist
+        
+        row_counts: Dict[str, int] = {}
+        rows_per_session = 0
+        for row in rows:
+            numbers = (row['stat'] or "").split()
+            if not numbers:
+                continue
+            row_counts[row['tbl']] = max(row_counts.get(row['tbl'], 0), int(numbers[0]))
+            if row['idx'] == "idx_session_timestamp" and len(numbers) > 1:
+                rows_per_session = int(numbers[1])
+        
+        if any(table not in row_counts for table in
+               ('conversation_history', 'user_preferences', 'learned_facts', 'user_facts')):
+            return None
+        
+        conversations = row_counts['conversation_history']
+        return {
+            'total_conversations': conversations,
+            'total_preferences': row_counts['user_preferences'],
+            'total_learned_facts': row_counts['learned_facts'],
+            'total_user_facts': row_counts['user_facts'],
+            'active_sessions': round(conversations / rows_per_session) if rows_per_session else 0
+        }
+    
     def cleanup_old_data(self, days_to_keep: int = 30) -> Dict[str, int]:
         """
         Clean up old database records
@@ -754,34 +1227,56 @@ class DatabaseManager:
         Returns:
             Dict: Cleanup results
         """
+        self._flush_metrics()
         try:
-            conn = self.get_connection("cleanup")
-            cursor = conn.cursor()
-            
-            cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-            results = {}
-            
-            # Clean conversation history
-            cursor.execute('''
-                DELETE FROM conversation_history WHERE timestamp < ?
-            ''', (cutoff_date,))
-            results['deleted_conversations'] = cursor.rowcount
-            
-            # Clean old metrics
-            cursor.execute('''
-                DELETE FROM system_metrics WHERE timestamp < ?
-            ''', (cutoff_date,))
-            results['deleted_metrics'] = cursor.rowcount
-            
-            conn.commit()
-            self.logger.info(f"Cleaned up old data: {results}")
-            
-            return results
+            with self.writer() as conn:
+                cutoff_modifier = f"-{int(days_to_keep)} days"
+                results = {
+                    'deleted_conversations': self._delete_older_than(conn, "conversation_history", cutoff_modifier),
+                    'deleted_metrics': self._delete_older_than(conn, "system_metrics", cutoff_modifier)
+                }
+                
+                # Row counts changed; re-estimate them for the planner and approximate stats
+                self._refresh_planner_stats(conn, force=True)
+                
+                # Move freed pages from the WAL into the main file and reset the WAL
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self.logger.info(f"Cleaned up old data: {results}")
+                return results
             
         except Exception as e:
             self.logger.error(f"Error cleaning up old data: {e}")
             return {}
     
+    def _delete_older_than(self, conn: sqlite3.Connection, table: str, cutoff_modifier: str) -> int:
+        """
+        Delete rows older than a cutoff in small batches
+        
+        Each batch commits on its own, so the WAL stays small and other
+        writers only wait for one batch instead of the whole cleanup.
+        
+        Args:
+            conn (sqlite3.Connection): Connection to delete through
+            table (str): Table with a timestamp column (internal name, not user input)
+            cutoff_modifier (str): datetime('now', ?) modifier such as '-30 days'
+            
+        Returns:
+            int: Number of deleted rows
+        """
+        deleted = 0
+        while True:
+            with _immediate_transaction(conn):
+                cursor = conn.execute(f'''
+                    DELETE FROM {table} WHERE rowid IN (
+                        SELECT rowid FROM {table}
+                        WHERE timestamp < datetime('now', ?)
+                        LIMIT ?
+                    )
+                ''', (cutoff_modifier, CLEANUP_BATCH_SIZE))
+            deleted += cursor.rowcount
+            if cursor.rowcount < CLEANUP_BATCH_SIZE:
+                return deleted
+    
     def backup_database(self, backup_path: str = None) -> bool:
         """
         Create database backup
@@ -801,19 +1296,50 @@ class DatabaseManager:
             backup_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Get connection to source database
-            source_conn = self.get_connection("backup_source")
-            
-            # Create backup
-            backup_conn = sqlite3.connect(str(backup_path))
-            source_conn.backup(backup_conn)
-            backup_conn.close()
+            with self.reader() as source_conn:
+                # Create backup
+                backup_conn = sqlite3.connect(str(backup_path))
+                source_conn.backup(backup_conn)
+                backup_conn.close()
             
-            self.logger.info(f"Database backed up to: {backup_path}")
-            return True
+                self.logger.info(f"Database backed up to: {backup_path}")
+                return True
             
         except Exception as e:
             self.logger.error(f"Error creating database backup: {e}")
             return False
+    
+    # Async variants for event-loop callers: the blocking call runs on a worker
+    # thread, and with WAL the read-only pool lets several reads overlap
+    
+    async def astore_conversation_with_metrics(self, *args, **kwargs) -> bool:
+        """Async variant of store_conversation_with_metrics"""
+        return await asyncio.to_thread(self.store_conversation_with_metrics, *args, **kwargs)
+    
+    async def aget_conversation_history(self, session_id: str, limit: int = 50,
+                                        hours_back: int = 24) -> List[Dict[str, Any]]:
+        """Async variant of get_conversation_history"""
+        return await asyncio.to_thread(self.get_conversation_history, session_id, limit, hours_back)
+    
+    async def aget_metrics_summary(self, category: str = None, hours_back: int = 24) -> Dict[str, Any]:
+        """Async variant of get_metrics_summary"""
+        return await asyncio.to_thread(self.get_metrics_summary, category, hours_back)
+    
+    async def aget_user_preference(self, user_id: str, category: str, key: str) -> Optional[str]:
+        """Async variant of get_user_preference"""
+        return await asyncio.to_thread(self.get_user_preference, user_id, category, key)
+    
+    async def aget_fact(self, fact_key: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_fact"""
+        return await asyncio.to_thread(self.get_fact, fact_key)
+    
+    async def aget_config_value(self, config_key: str, default_value: str = None) -> str:
+        """Async variant of get_config_value"""
+        return await asyncio.to_thread(self.get_config_value, config_key, default_value)
+    
+    async def aget_database_stats(self, exact: bool = True) -> Dict[str, Any]:
+        """Async variant of get_database_stats"""
+        return await asyncio.to_thread(self.get_database_stats, exact)
 
 # Test function
 def test_database_manager():
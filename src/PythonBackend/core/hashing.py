@@ -0,0 +1,27 @@
+"""
+Content hashing shared by the conversation stores
+"""
+
+import hashlib
+
+# Separates the fields so ("ab", "c") and ("a", "bc") hash differently
+_FIELD_SEPARATOR = b"\x1f"
+
+def interaction_hash(user_input: str, ai_response: str) -> str:
+    """
+    Hash one user input / AI response pair for the context_hash column
+
+    Not security relevant; BLAKE2b-128 is faster than MD5.
+
+    Args:
+        user_input (str): User's input text
+        ai_response (str): AI's response text
+
+    Returns:
+        str: 32-character hex digest
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(user_input.encode())
+    hasher.update(_FIELD_SEPARATOR)
+    hasher.update(ai_response.encode())
+    return hasher.hexdigest()
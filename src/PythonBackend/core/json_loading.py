@@ -0,0 +1,59 @@
+"""
+JSON file loading shared by the profile and character loaders
+"""
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Sequence, Tuple
+
+# Faster JSON parsing when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Below this many files the thread pool costs more than it saves
+PARALLEL_LOAD_THRESHOLD = 4
+MAX_LOAD_WORKERS = 8
+
+def loads(data) -> Any:
+    """Parse JSON from bytes or a buffer with the fastest available decoder"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+def load_json_files(paths: Sequence[Any], read_file: Callable[[Any], Any],
+                    logger: logging.Logger, kind: str = "file") -> List[Tuple[Any, Any]]:
+    """
+    Read and parse several JSON files, in parallel when there are enough of them
+
+    Args:
+        paths (Sequence): File paths to load
+        read_file (Callable): Reads and parses one path
+        logger (Logger): Logger that receives a warning for each file that fails
+        kind (str): What the files hold, used in the warning
+
+    Returns:
+        List[Tuple]: (path, data) for every file that loaded, in the order of paths
+    """
+    def try_read(path):
+        try:
+            return read_file(path), None
+        except Exception as e:
+            return None, e
+
+    if len(paths) < PARALLEL_LOAD_THRESHOLD:
+        results = [try_read(path) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(paths))) as pool:
+            results = list(pool.map(try_read, paths))
+
+    loaded = []
+    for path, (data, error) in zip(paths, results):
+        if error is not None:
+            logger.warning("Could not load %s %s: %s", kind, path, error)
+        else:
+            loaded.append((path, data))
+    return loaded
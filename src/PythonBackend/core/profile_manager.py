@@ -4,10 +4,31 @@ Handles loading and managing AI assistant profiles
 """
 
 import json
+import logging
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    from .json_loading import load_json_files, loads
+except ImportError:
+    from json_loading import load_json_files, loads
+
+logger = logging.getLogger('ProfileManager')
+
+def _read_profile_file(path: Path) -> Any:
+    """
+    Read and parse a single profile file
+    
+    Args:
+        path (Path): Path to the profile JSON file
+        
+    Returns:
+        Any: Parsed profile data
+    """
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
 class ProfileManager:
     """Manage AI assistant profiles"""
     
@@ -21,6 +42,9 @@ class ProfileManager:
         self.config_path = Path(config_path)
         self.profiles_dir = self.config_path / "profiles"
         self.profiles = {}
+        # list_profiles / get_profile_names önbelleği, load_profiles içinde kurulur
+        self._profile_summaries: List[Dict[str, Any]] = []
+        self._profile_ids: Tuple[str, ...] = ()
         self.default_profiles = self._create_default_profiles()
         self._ensure_directories_exist()
         self.load_profiles()
@@ -126,23 +150,48 @@ class ProfileManager:
             
             # Profil dizinindeki JSON dosyalarını kontrol et
             if self.profiles_dir.exists():
-                for profile_file in self.profiles_dir.glob("*.json"):
-                    try:
-                        with open(profile_file, 'r', encoding='utf-8') as f:
-                            profile_data = json.load(f)
-                            profile_id = profile_data.get('id', profile_file.stem)
-                            self.profiles[profile_id] = profile_data
-                    except Exception as e:
-                        print(f"Warning: Could not load profile {profile_file}: {e}")
+                # Dosya okuma/parse paralel, sözlüğe yazma ana thread'de (dosya sırasıyla)
+                paths = list(self.profiles_dir.glob("*.json"))
+                for path, profile_data in load_json_files(paths, _read_profile_file, logger, "profile"):
+                    self.profiles[profile_data.get('id', path.stem)] = profile_data
             
+            self._rebuild_profile_cache()
             return self.profiles
             
         except Exception as e:
             print(f"Error loading profiles: {e}")
             # En azından varsayılan profilleri döndür
             self.profiles = self.default_profiles
+            self._rebuild_profile_cache()
             return self.profiles
     
+    @staticmethod
+    def _profile_summary(profile_id: str, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the basic info entry list_profiles returns for a profile
+        
+        Args:
+            profile_id (str): Profile identifier
+            profile_data (Dict): Profile data
+            
+        Returns:
+            Dict: Profile summary
+        """
+        return {
+            "id": profile_id,
+            "name": profile_data.get("name", {}),
+            "description": profile_data.get("description", {}),
+            "supported_languages": profile_data.get("supported_languages", [])
+        }
+    
+    def _rebuild_profile_cache(self):
+        """Precompute profile summaries and ids in one pass over self.profiles"""
+        self._profile_summaries = [
+            self._profile_summary(profile_id, profile_data)
+            for profile_id, profile_data in self.profiles.items()
+        ]
+        self._profile_ids = tuple(self.profiles)
+    
     def get_profile(self, profile_id: str) -> Optional[Dict[str, Any]]:
         """
         Get specific profile by ID
@@ -162,15 +211,8 @@ class ProfileManager:
         Returns:
             List[Dict]: List of profile summaries
         """
-        profile_list = []
-        for profile_id, profile_data in self.profiles.items():
-            profile_list.append({
-                "id": profile_id,
-                "name": profile_data.get("name", {}),
-                "description": profile_data.get("description", {}),
-                "supported_languages": profile_data.get("supported_languages", [])
-            })
-        return profile_list
+        # Kopya: çağıranın listeyi değiştirmesi önbelleği bozmasın
+        return list(self._profile_summaries)
     
     def get_profile_names(self) -> List[str]:
         """
@@ -179,7 +221,7 @@ class ProfileManager:
         Returns:
             List[str]: List of profile identifiers
         """
-        return list(self.profiles.keys())
+        return list(self._profile_ids)
     
     def validate_profile_requirements(self, profile_id: str, system_info: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -209,7 +251,7 @@ class ProfileManager:
     
     def save_profile(self, profile_id: str, profile_data: Dict[str, Any]) -> bool:
         """
-        Save profile to file (future feature)
+        Save profile to file and make it available immediately
         
         Args:
             profile_id (str): Profile identifier
@@ -222,6 +264,16 @@ class ProfileManager:
             profile_file = self.profiles_dir / f"{profile_id}.json"
             with open(profile_file, 'w', encoding='utf-8') as f:
                 json.dump(profile_data, f, ensure_ascii=False, indent=2)
+            
+            # Önbelleği yeniden kurmadan ilgili özeti yerinde güncelle
+            summary = self._profile_summary(profile_id, profile_data)
+            if profile_id in self.profiles:
+                index = self._profile_ids.index(profile_id)
+                self._profile_summaries[index] = summary
+            else:
+                self._profile_summaries.append(summary)
+                self._profile_ids += (profile_id,)
+            self.profiles[profile_id] = profile_data
             return True
         except Exception as e:
             print(f"Error saving profile {profile_id}: {e}")
@@ -10,7 +10,7 @@ import sqlite3
 import hashlib
 import logging
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator
 from pathlib import Path
 from datetime import datetime
 from watchdog.observers import Observer
@@ -215,9 +215,22 @@ class SyncService:
         Returns:
             Dict: Sync results
         """
+        results = {}
+        for event in self.iter_sync_vault_to_db():
+            results = event
+        return results
+    
+    def iter_sync_vault_to_db(self) -> Iterator[Dict[str, Any]]:
+        """
+        Synchronize Obsidian vault to database, reporting progress as it goes
+        
+        Yields:
+            Dict: One progress event per synced category, then the final sync results
+        """
         if self.is_syncing:
             self.logger.warning("Sync already in progress")
-            return {"status": "warning", "message": "Sync already in progress"}
+            yield {"status": "warning", "message": "Sync already in progress"}
+            return
         
         self.is_syncing = True
         sync_start_time = time.time()
@@ -250,11 +263,14 @@ class SyncService:
                     
                     if category_results.get("errors"):
                         results["errors"].extend(category_results["errors"])
+                    
+                    yield {"status": "progress", "category": category_name, **category_results}
                         
                 except Exception as e:
                     error_msg = f"Error syncing {category_name}: {str(e)}"
                     self.logger.error(error_msg)
                     results["errors"].append(error_msg)
+                    yield {"status": "progress", "category": category_name, "errors": [error_msg]}
             
             # Update sync tracking
             self._update_sync_tracking()
@@ -278,7 +294,7 @@ class SyncService:
         finally:
             self.is_syncing = False
         
-        return results
+        yield results
     
     def _sync_profiles(self) -> Dict[str, Any]:
         """Sync profile files from vault to database"""
@@ -774,6 +790,11 @@ class SyncService:
         self.logger.info("⚡ Force sync initiated")
         return self.sync_vault_to_db()
     
+    def iter_force_sync(self) -> Iterator[Dict[str, Any]]:
+        """Force immediate sync, yielding per-category progress events"""
+        self.logger.info("⚡ Force sync initiated")
+        return self.iter_sync_vault_to_db()
+    
     def get_tracked_files(self) -> List[Dict[str, Any]]:
         """Get list of tracked files"""
         try:
@@ -4,11 +4,20 @@ Windows AI Assistant - Python Backend with Web GUI
 """
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse
 import uvicorn
 
+from api.routes.ai_routes import router as ai_router
+
 app = FastAPI(title="Windows AI Assistant")
 
+# Büyük JSON yanıtlarını (istatistik/metrik) sıkıştır
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# AI engine endpoints under /ai; the engine is created by the router's startup hook
+app.include_router(ai_router)
+
 # Basit HTML içeriği
 HTML_CONTENT = '''<!DOCTYPE html>
 <html>